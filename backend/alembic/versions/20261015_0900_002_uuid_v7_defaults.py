@@ -0,0 +1,69 @@
+"""Time-ordered UUIDv7 primary key defaults
+
+Revision ID: 002
+Revises: 001
+Create Date: 2026-10-15 09:00:00
+
+Random UUIDv4 keys scatter inserts across the whole primary key B-tree.
+UUIDv7 keys start with a millisecond timestamp, so new rows land in the
+rightmost leaf page (better cache locality, fewer page splits).
+
+This migration:
+- Installs a gen_uuid_v7() SQL function (built on gen_random_uuid(), PG13+)
+- Uses it as the server default for every primary key
+
+The ORM also generates UUIDv7 client-side (uuid6.uuid7), so the server
+default only applies to rows inserted outside the application.
+The column type is unchanged (still UUID).
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '002'
+down_revision: Union[str, None] = '001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLES = ('users', 'api_keys', 'consultation_requests', 'webhook_deliveries')
+
+
+def upgrade() -> None:
+    """Install gen_uuid_v7() and use it for primary key defaults."""
+
+    # Take a random v4 UUID, overlay the first 48 bits with the Unix epoch in
+    # milliseconds, then flip the version nibble from 4 (0100) to 7 (0111).
+    op.execute("""
+        CREATE OR REPLACE FUNCTION gen_uuid_v7() RETURNS uuid AS $$
+            SELECT encode(
+                set_bit(
+                    set_bit(
+                        overlay(
+                            uuid_send(gen_random_uuid())
+                            placing substring(
+                                int8send(floor(extract(epoch FROM clock_timestamp()) * 1000)::bigint)
+                                FROM 3
+                            )
+                            FROM 1 FOR 6
+                        ),
+                        52, 1
+                    ),
+                    53, 1
+                ),
+                'hex'
+            )::uuid
+        $$ LANGUAGE sql VOLATILE
+    """)
+
+    for table in TABLES:
+        op.alter_column(table, 'id', server_default=sa.text('gen_uuid_v7()'))
+
+
+def downgrade() -> None:
+    """Remove primary key defaults and drop gen_uuid_v7()."""
+    for table in TABLES:
+        op.alter_column(table, 'id', server_default=None)
+
+    op.execute("DROP FUNCTION IF EXISTS gen_uuid_v7()")
@@ -0,0 +1,42 @@
+"""Composite (state, created_at DESC) index for request listing
+
+Revision ID: 003
+Revises: 002
+Create Date: 2026-10-15 09:15:00
+
+list_requests filters by state and orders by created_at DESC. With only a
+single-column index on state, Postgres has to sort every matching row before
+applying LIMIT/OFFSET. The composite index returns rows already in order, so
+a page is a short walk along the index.
+
+The single-column state index becomes redundant (state is the leading
+column of the new index) and is dropped.
+
+Both index changes run CONCURRENTLY so request creation isn't blocked
+while the index is built on a populated table.
+"""
+from typing import Sequence, Union
+
+from app.db.migrations import create_index_concurrently, drop_index_concurrently
+
+# revision identifiers, used by Alembic.
+revision: str = '003'
+down_revision: Union[str, None] = '002'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Replace the state index with (state, created_at DESC)."""
+    create_index_concurrently(
+        'ix_cr_state_created_at',
+        'consultation_requests',
+        'state, created_at DESC',
+    )
+    drop_index_concurrently('ix_consultation_requests_state')
+
+
+def downgrade() -> None:
+    """Restore the single-column state index."""
+    create_index_concurrently('ix_consultation_requests_state', 'consultation_requests', 'state')
+    drop_index_concurrently('ix_cr_state_created_at')
@@ -0,0 +1,48 @@
+"""Store API key hashes as 32-byte BYTEA
+
+Revision ID: 004
+Revises: 003
+Create Date: 2026-10-15 09:30:00
+
+key_hash was a 64-character hex string. Storing the raw SHA256 digest
+halves the size of the key_hash index. Existing hashes are converted in
+place with decode(key_hash, 'hex'), so previously issued keys keep working.
+
+New keys embed their row ID ("gf_<id>.<secret>") and are verified with a
+primary key lookup; the key_hash index is only used for older keys.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = '004'
+down_revision: Union[str, None] = '003'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Convert api_keys.key_hash from hex VARCHAR(64) to BYTEA."""
+    op.alter_column(
+        'api_keys',
+        'key_hash',
+        type_=postgresql.BYTEA(),
+        existing_type=sa.String(length=64),
+        existing_nullable=False,
+        postgresql_using="decode(key_hash, 'hex')",
+    )
+
+
+def downgrade() -> None:
+    """Convert api_keys.key_hash back to hex VARCHAR(64)."""
+    op.alter_column(
+        'api_keys',
+        'key_hash',
+        type_=sa.String(length=64),
+        existing_type=postgresql.BYTEA(),
+        existing_nullable=False,
+        postgresql_using="encode(key_hash, 'hex')",
+    )
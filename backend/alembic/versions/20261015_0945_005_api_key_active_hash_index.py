@@ -0,0 +1,38 @@
+"""Partial index on active API key hashes
+
+Revision ID: 005
+Revises: 004
+Create Date: 2026-10-15 09:45:00
+
+Legacy API keys (issued before keys embedded their row ID) are looked up
+with WHERE key_hash = ... AND is_active. A partial index over active keys
+only skips revoked rows at the B-tree level and stays small (and in cache)
+as revoked keys accumulate.
+
+The unique index on key_hash is kept - it enforces uniqueness across
+active and revoked keys.
+"""
+from typing import Sequence, Union
+
+from app.db.migrations import create_index_concurrently, drop_index_concurrently
+
+# revision identifiers, used by Alembic.
+revision: str = '005'
+down_revision: Union[str, None] = '004'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add the partial index on active key hashes."""
+    create_index_concurrently(
+        'ix_api_keys_key_hash_active',
+        'api_keys',
+        'key_hash',
+        where='is_active',
+    )
+
+
+def downgrade() -> None:
+    """Drop the partial index on active key hashes."""
+    drop_index_concurrently('ix_api_keys_key_hash_active')
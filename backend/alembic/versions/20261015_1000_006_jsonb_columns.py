@@ -0,0 +1,72 @@
+"""Store JSON columns as JSONB and index request metadata
+
+Revision ID: 006
+Revises: 005
+Create Date: 2026-10-15 10:00:00
+
+JSON columns keep the raw text and re-parse it on every read; JSONB stores
+a decomposed binary form that is faster to read and can be GIN-indexed.
+
+This migration:
+- Converts context, response, metadata (consultation_requests) and
+  payload (webhook_deliveries) from JSON to JSONB
+- Adds a GIN index (jsonb_path_ops) on consultation_requests.metadata for
+  containment filters like metadata @> '{"workflow_id": "wf-123"}'
+
+Note: the type change rewrites both tables under an exclusive lock.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from app.db.migrations import create_index_concurrently, drop_index_concurrently
+
+# revision identifiers, used by Alembic.
+revision: str = '006'
+down_revision: Union[str, None] = '005'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+COLUMNS = (
+    ('consultation_requests', 'context', False),
+    ('consultation_requests', 'response', True),
+    ('consultation_requests', 'metadata', True),
+    ('webhook_deliveries', 'payload', False),
+)
+
+
+def upgrade() -> None:
+    """Convert JSON columns to JSONB and add the metadata GIN index."""
+    for table, column, nullable in COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            type_=postgresql.JSONB(astext_type=sa.Text()),
+            existing_type=postgresql.JSON(astext_type=sa.Text()),
+            existing_nullable=nullable,
+            postgresql_using=f'"{column}"::jsonb',
+        )
+
+    create_index_concurrently(
+        'ix_cr_metadata_gin',
+        'consultation_requests',
+        'metadata jsonb_path_ops',
+        using='gin',
+    )
+
+
+def downgrade() -> None:
+    """Drop the metadata GIN index and convert JSONB columns back to JSON."""
+    drop_index_concurrently('ix_cr_metadata_gin')
+
+    for table, column, nullable in COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            type_=postgresql.JSON(astext_type=sa.Text()),
+            existing_type=postgresql.JSONB(astext_type=sa.Text()),
+            existing_nullable=nullable,
+            postgresql_using=f'"{column}"::json',
+        )
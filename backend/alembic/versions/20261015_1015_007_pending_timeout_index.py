@@ -0,0 +1,43 @@
+"""Partial index on timeout_at for pending requests
+
+Revision ID: 007
+Revises: 006
+Create Date: 2026-10-15 10:15:00
+
+The timeout sweep only looks at pending requests:
+
+    SELECT id FROM consultation_requests
+    WHERE state = 'pending' AND timeout_at < now()
+
+The full timeout_at index also carries every responded/completed request,
+which can never match. A partial index over pending rows only is a fraction
+of the size and shrinks as requests are answered.
+"""
+from typing import Sequence, Union
+
+from app.db.migrations import create_index_concurrently, drop_index_concurrently
+
+# revision identifiers, used by Alembic.
+revision: str = '007'
+down_revision: Union[str, None] = '006'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Replace the timeout_at index with a partial index on pending rows."""
+    create_index_concurrently(
+        'ix_cr_timeout_pending',
+        'consultation_requests',
+        'timeout_at',
+        where="state = 'pending'",
+    )
+    drop_index_concurrently('ix_consultation_requests_timeout_at')
+
+
+def downgrade() -> None:
+    """Restore the full timeout_at index."""
+    create_index_concurrently(
+        'ix_consultation_requests_timeout_at', 'consultation_requests', 'timeout_at'
+    )
+    drop_index_concurrently('ix_cr_timeout_pending')
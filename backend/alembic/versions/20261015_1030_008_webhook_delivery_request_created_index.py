@@ -0,0 +1,43 @@
+"""Composite index on webhook_deliveries (request_id, created_at)
+
+Revision ID: 008
+Revises: 007
+Create Date: 2026-10-15 10:30:00
+
+Deliveries are read per request in attempt order (and the latest attempt
+for a request is the last entry):
+
+    SELECT * FROM webhook_deliveries
+    WHERE request_id = :id
+    ORDER BY created_at DESC
+
+With only the request_id index, Postgres fetches every attempt for the
+request and sorts them. (request_id, created_at) returns them already
+ordered, and still serves plain request_id lookups (e.g. the foreign key
+check when a request is deleted), so it replaces the single-column index.
+"""
+from typing import Sequence, Union
+
+from app.db.migrations import create_index_concurrently, drop_index_concurrently
+
+# revision identifiers, used by Alembic.
+revision: str = '008'
+down_revision: Union[str, None] = '007'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Replace the request_id index with (request_id, created_at)."""
+    create_index_concurrently(
+        'ix_wd_request_created', 'webhook_deliveries', 'request_id, created_at'
+    )
+    drop_index_concurrently('ix_webhook_deliveries_request_id')
+
+
+def downgrade() -> None:
+    """Restore the single-column request_id index."""
+    create_index_concurrently(
+        'ix_webhook_deliveries_request_id', 'webhook_deliveries', 'request_id'
+    )
+    drop_index_concurrently('ix_wd_request_created')
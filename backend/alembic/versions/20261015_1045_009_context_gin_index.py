@@ -0,0 +1,40 @@
+"""GIN index on consultation_requests.context
+
+Revision ID: 009
+Revises: 008
+Create Date: 2026-10-15 10:45:00
+
+context has been JSONB since 006. Like metadata, it gets a jsonb_path_ops
+GIN index so agent filters such as
+
+    SELECT * FROM consultation_requests
+    WHERE context @> '{"agent_id": "code-review-agent"}'
+
+use an index scan instead of reading every row. jsonb_path_ops only
+supports containment (@>), but is much smaller than the default jsonb_ops,
+which matters here because context can carry large blobs (code diffs etc.).
+"""
+from typing import Sequence, Union
+
+from app.db.migrations import create_index_concurrently, drop_index_concurrently
+
+# revision identifiers, used by Alembic.
+revision: str = '009'
+down_revision: Union[str, None] = '008'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add a GIN index on context."""
+    create_index_concurrently(
+        'ix_cr_context_gin',
+        'consultation_requests',
+        'context jsonb_path_ops',
+        using='gin',
+    )
+
+
+def downgrade() -> None:
+    """Drop the context GIN index."""
+    drop_index_concurrently('ix_cr_context_gin')
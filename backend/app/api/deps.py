@@ -4,41 +4,46 @@ Provides reusable dependencies for:
 - Database sessions
 - User authentication (JWT)
 - API key authentication (for agents)
+
+Authenticated principals are cached in-process for a short TTL so that
+repeated requests with the same token/key don't hit Postgres every time
+(see app.services.auth_cache, which drops revoked API keys in every worker).
 """
 
-from typing import Generator, Optional
+import hashlib
+import hmac
+from typing import AsyncGenerator, Optional
 from uuid import UUID
 
-from fastapi import Depends, HTTPException, status, Header
+from fastapi import Depends, HTTPException, Request, status, Header
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.security import verify_token, hash_api_key
-from app.db.session import SessionLocal
+from app.core.security import verify_token, hash_api_key_cached, parse_api_key_id
+from app.db.session import AsyncSessionLocal
 from app.models import User, APIKey
+from app.services.auth_cache import api_key_cache, user_cache
 
 # Security scheme for Swagger UI
 security = HTTPBearer()
 
-
-def get_db() -> Generator[Session, None, None]:
+async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """Get database session.
 
     Usage:
         @app.get("/items")
-        def read_items(db: Session = Depends(get_db)):
-            return db.query(Item).all()
+        async def read_items(db: AsyncSession = Depends(get_db)):
+            return (await db.scalars(select(Item))).all()
     """
-    db = SessionLocal()
-    try:
+    async with AsyncSessionLocal() as db:
         yield db
-    finally:
-        db.close()
 
 
 async def get_current_user(
+    request: Request,
     credentials: HTTPAuthorizationCredentials = Depends(security),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ) -> User:
     """Get current authenticated user from JWT token.
 
@@ -47,6 +52,10 @@ async def get_current_user(
         def read_current_user(user: User = Depends(get_current_user)):
             return {"email": user.email}
 
+    The user is stored on `request.state.user`, so the token is verified at
+    most once per HTTP request even if several dependencies (or middleware)
+    call back into this function.
+
     Raises:
         HTTPException 401: If token is invalid or user not found
     """
@@ -56,6 +65,10 @@ async def get_current_user(
         headers={"WWW-Authenticate": "Bearer"},
     )
 
+    user = getattr(request.state, "user", None)
+    if user is not None:
+        return user
+
     token = credentials.credentials
     payload = verify_token(token)
 
@@ -66,15 +79,27 @@ async def get_current_user(
     if user_id is None:
         raise credentials_exception
 
+    # Tokens issued before jti was added fall back to a hash of the raw token
+    cache_key = payload.get("jti") or hashlib.sha256(token.encode()).hexdigest()
+    user = user_cache.get(cache_key)
+    if user is not None:
+        request.state.user = user
+        return user
+
     try:
         user_uuid = UUID(user_id)
     except ValueError:
         raise credentials_exception
 
-    user = db.query(User).filter(User.id == user_uuid).first()
+    user = await db.get(User, user_uuid)
     if user is None or not user.is_active:
         raise credentials_exception
 
+    # Detach so a later commit in this request can't expire the cached object
+    db.expunge(user)
+    user_cache[cache_key] = user
+    request.state.user = user
+
     return user
 
 
@@ -97,7 +122,7 @@ async def get_current_active_user(
 
 async def verify_api_key_dependency(
     authorization: Optional[str] = Header(None),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ) -> APIKey:
     """Verify API key from Authorization header.
 
@@ -105,7 +130,7 @@ async def verify_api_key_dependency(
         @app.post("/api/v1/requests")
         def create_request(
             api_key: APIKey = Depends(verify_api_key_dependency),
-            db: Session = Depends(get_db)
+            db: AsyncSession = Depends(get_db)
         ):
             # api_key.name shows which agent made the request
             return {"message": f"Request from {api_key.name}"}
@@ -113,6 +138,10 @@ async def verify_api_key_dependency(
     Expects header:
         Authorization: Bearer <api_key>
 
+    Keys in the "gf_<key id>.<secret>" format are looked up by primary key and
+    the hash compared in constant time. Older keys without an embedded ID
+    fall back to a lookup by key_hash.
+
     Raises:
         HTTPException 401: If API key is invalid or inactive
     """
@@ -123,23 +152,35 @@ async def verify_api_key_dependency(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    # Extract key from "Bearer <key>"
-    try:
-        scheme, key = authorization.split()
-        if scheme.lower() != "bearer":
-            raise ValueError()
-    except ValueError:
+    # Extract key from "Bearer <key>" (prefix check, no split/lowercasing the key)
+    key = authorization[7:].strip()
+    if authorization[:7].lower() != "bearer " or not key or " " in key:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid authorization header format. Use: Bearer <api_key>",
         )
 
-    # Hash the provided key and look up in database
-    key_hash = hash_api_key(key)
-    api_key = db.query(APIKey).filter(
-        APIKey.key_hash == key_hash,
-        APIKey.is_active == True
-    ).first()
+    # Hash the provided key and look up in cache, then database
+    key_hash = hash_api_key_cached(key)
+    api_key = api_key_cache.get(key_hash)
+    if api_key is not None:
+        return api_key
+
+    key_id = parse_api_key_id(key)
+    if key_id is not None:
+        api_key = await db.get(APIKey, key_id)
+        if api_key is not None and not (
+            api_key.is_active and hmac.compare_digest(api_key.key_hash, key_hash)
+        ):
+            api_key = None
+    else:
+        # Legacy key (issued before IDs were embedded in keys)
+        api_key = await db.scalar(
+            select(APIKey).where(
+                APIKey.key_hash == key_hash,
+                APIKey.is_active == True
+            )
+        )
 
     if not api_key:
         raise HTTPException(
@@ -147,4 +188,7 @@ async def verify_api_key_dependency(
             detail="Invalid or inactive API key",
         )
 
+    db.expunge(api_key)
+    api_key_cache[key_hash] = api_key
+
     return api_key
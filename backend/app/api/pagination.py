@@ -0,0 +1,63 @@
+"""Keyset (cursor) pagination helpers.
+
+List endpoints return newest rows first, ordered by (created_at DESC, id DESC).
+Instead of OFFSET (which makes Postgres walk and discard every skipped row),
+clients pass the cursor of the last row they saw and the next page starts
+right after it:
+
+    WHERE (created_at, id) < (:after_ts, :after_id)
+    ORDER BY created_at DESC, id DESC
+    LIMIT :limit
+
+A cursor is an opaque URL-safe base64 string encoding "<created_at ISO>|<id>".
+"""
+
+import base64
+import binascii
+from datetime import datetime
+from typing import Any, Optional
+from uuid import UUID
+
+from fastapi import HTTPException, status
+from sqlalchemy import Select, tuple_
+
+
+def encode_cursor(created_at: datetime, id: UUID) -> str:
+    """Encode a (created_at, id) position as an opaque cursor string."""
+    raw = f"{created_at.isoformat()}|{id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, UUID]:
+    """Decode a cursor produced by encode_cursor.
+
+    Raises:
+        HTTPException 400: If the cursor is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, id = base64.urlsafe_b64decode(padded).decode().split("|", 1)
+        return datetime.fromisoformat(created_at), UUID(id)
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid pagination cursor",
+        ) from None
+
+
+def apply_keyset(query: Select[Any], model: Any, after: Optional[str]) -> Select[Any]:
+    """Order a query newest-first and, if given, start after the `after` cursor."""
+    if after:
+        after_ts, after_id = decode_cursor(after)
+        query = query.where(tuple_(model.created_at, model.id) < tuple_(after_ts, after_id))
+
+    return query.order_by(model.created_at.desc(), model.id.desc())
+
+
+def next_cursor(items: list[Any], limit: Optional[int]) -> Optional[str]:
+    """Return the cursor for the page after `items`, or None if this is the last page."""
+    if not items or limit is None or len(items) < limit:
+        return None
+
+    last = items[-1]
+    return encode_cursor(last.created_at, last.id)
@@ -0,0 +1,36 @@
+"""Fast JSON responses for trusted, ORM-sourced data.
+
+With a `response_model`, FastAPI validates and serializes every item
+through Pydantic. For list endpoints returning rows straight from the
+database that's pure overhead: the values are already the right types.
+
+Routes can instead build plain dicts from the rows (see
+`ORMResponse.dump_orm`, or the request endpoints' column-based items) and
+return a `FastJSONResponse`, which encodes them in one orjson call. Keep
+`response_model=` on the route - it still drives the OpenAPI docs, FastAPI
+just skips it when a Response is returned.
+
+The output matches Pydantic's JSON: UUIDs as strings, UTC datetimes as
+ISO 8601 with a "Z" suffix.
+"""
+
+from typing import Any
+from uuid import UUID
+
+import orjson
+from fastapi.responses import JSONResponse
+
+
+def _default(obj: Any) -> Any:
+    """Encode types orjson doesn't handle natively."""
+    # asyncpg returns its own UUID subclass, which orjson doesn't recognize
+    if isinstance(obj, UUID):
+        return str(obj)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+class FastJSONResponse(JSONResponse):
+    """JSONResponse encoded with orjson (no validation, no str round-trip)."""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, default=_default, option=orjson.OPT_UTC_Z)
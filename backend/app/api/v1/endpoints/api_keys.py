@@ -6,16 +6,20 @@ Allows admins to:
 - Revoke API keys
 """
 
-from typing import List
+from typing import List, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from uuid6 import uuid7
 
 from app.api.deps import get_db, get_current_user
+from app.api.pagination import apply_keyset, next_cursor
 from app.core.security import generate_api_key, hash_api_key
 from app.models import User, APIKey
 from app.schemas import APIKeyCreate, APIKeyCreated, APIKeyResponse, APIKeyUpdate
+from app.services.auth_cache import invalidate_api_key
 
 router = APIRouter()
 
@@ -24,7 +28,7 @@ router = APIRouter()
 async def create_api_key(
     key_data: APIKeyCreate,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ):
     """Create a new API key.
 
@@ -42,7 +46,7 @@ async def create_api_key(
     Returns:
         {
             "id": "...",
-            "key": "hKj8sH3nX...",  # RAW KEY - SHOWN ONCE!
+            "key": "gf_01932c4e-....hKj8sH3nX...",  # RAW KEY - SHOWN ONCE!
             "name": "code-review-agent",
             "created_at": "..."
         }
@@ -51,22 +55,23 @@ async def create_api_key(
     # if current_user.role != "admin":
     #     raise HTTPException(status_code=403, detail="Admin access required")
 
-    # Generate raw key
-    raw_key = generate_api_key()
+    # Generate raw key (embeds the row ID, so pick the ID up front)
+    key_id = uuid7()
+    raw_key = generate_api_key(key_id)
 
     # Hash for storage
     key_hash = hash_api_key(raw_key)
 
     # Create API key
     db_key = APIKey(
+        id=key_id,
         key_hash=key_hash,
         name=key_data.name,
         description=key_data.description,
     )
 
     db.add(db_key)
-    db.commit()
-    db.refresh(db_key)
+    await db.commit()
 
     # Return raw key ONCE
     return {
@@ -80,24 +85,44 @@ async def create_api_key(
 
 @router.get("/", response_model=List[APIKeyResponse])
 async def list_api_keys(
+    response: Response,
+    limit: Optional[int] = Query(None, ge=1, le=1000, description="Page size (default: all keys)"),
+    after: Optional[str] = Query(None, description="Cursor from a previous X-Next-Cursor header"),
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ):
-    """List all API keys (without raw keys).
+    """List API keys (without raw keys), newest first.
 
     Example:
         GET /api/v1/api-keys
         Authorization: Bearer <jwt_token>
+
+    Paginated (keyset):
+        GET /api/v1/api-keys?limit=50
+        GET /api/v1/api-keys?limit=50&after=<X-Next-Cursor from previous page>
+
+    The body stays a plain list; the next-page cursor is returned in the
+    X-Next-Cursor header when there may be more keys.
     """
-    keys = db.query(APIKey).order_by(APIKey.created_at.desc()).all()
-    return keys
+    query = apply_keyset(select(APIKey), APIKey, after)
+    if limit is not None:
+        query = query.limit(limit)
+
+    keys = (await db.scalars(query)).all()
+
+    cursor = next_cursor(keys, limit)
+    if cursor:
+        response.headers["X-Next-Cursor"] = cursor
+
+    # Rows come from the DB: build the items without re-validating them
+    return [APIKeyResponse.from_orm_fast(key) for key in keys]
 
 
 @router.get("/{key_id}", response_model=APIKeyResponse)
 async def get_api_key(
     key_id: UUID,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ):
     """Get a specific API key.
 
@@ -105,7 +130,7 @@ async def get_api_key(
         GET /api/v1/api-keys/550e8400-...
         Authorization: Bearer <jwt_token>
     """
-    key = db.query(APIKey).filter(APIKey.id == key_id).first()
+    key = await db.get(APIKey, key_id)
 
     if not key:
         raise HTTPException(status_code=404, detail="API key not found")
@@ -118,7 +143,7 @@ async def update_api_key(
     key_id: UUID,
     key_data: APIKeyUpdate,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ):
     """Update an API key (typically to revoke).
 
@@ -130,7 +155,7 @@ async def update_api_key(
             "is_active": false  # Revoke the key
         }
     """
-    key = db.query(APIKey).filter(APIKey.id == key_id).first()
+    key = await db.get(APIKey, key_id)
 
     if not key:
         raise HTTPException(status_code=404, detail="API key not found")
@@ -143,7 +168,10 @@ async def update_api_key(
     if key_data.is_active is not None:
         key.is_active = key_data.is_active
 
-    db.commit()
-    db.refresh(key)
+    await db.commit()
+
+    # Drop the cached key in every worker (broadcast over Redis), so a
+    # revocation doesn't wait for the cache TTL
+    await invalidate_api_key(key.key_hash)
 
     return key
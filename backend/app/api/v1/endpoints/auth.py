@@ -10,10 +10,15 @@ from datetime import timedelta
 
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordRequestForm
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps import get_db, get_current_user
-from app.core.security import hash_password, verify_password, create_access_token
+from app.core.security import (
+    hash_password_async,
+    verify_and_update_password_async,
+    create_access_token,
+)
 from app.core.config import settings
 from app.models import User
 from app.schemas import UserCreate, UserResponse
@@ -24,7 +29,7 @@ router = APIRouter()
 @router.post("/register", response_model=UserResponse, status_code=201)
 async def register(
     user_data: UserCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ):
     """Register a new user.
 
@@ -38,7 +43,7 @@ async def register(
         }
     """
     # Check if user already exists
-    existing_user = db.query(User).filter(User.email == user_data.email).first()
+    existing_user = await db.scalar(select(User).where(User.email == user_data.email))
     if existing_user:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -46,7 +51,7 @@ async def register(
         )
 
     # Create new user
-    hashed_password = hash_password(user_data.password)
+    hashed_password = await hash_password_async(user_data.password)
     db_user = User(
         email=user_data.email,
         name=user_data.name,
@@ -55,16 +60,15 @@ async def register(
     )
 
     db.add(db_user)
-    db.commit()
-    db.refresh(db_user)
+    await db.commit()
 
-    return db_user
+    return UserResponse.from_orm_fast(db_user)
 
 
 @router.post("/login")
 async def login(
     form_data: OAuth2PasswordRequestForm = Depends(),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ):
     """Login to get JWT token.
 
@@ -82,9 +86,16 @@ async def login(
         }
     """
     # Find user by email
-    user = db.query(User).filter(User.email == form_data.username).first()
+    user = await db.scalar(select(User).where(User.email == form_data.username))
 
-    if not user or not verify_password(form_data.password, user.hashed_password):
+    if user:
+        is_valid, new_hash = await verify_and_update_password_async(
+            form_data.password, user.hashed_password
+        )
+    else:
+        is_valid, new_hash = False, None
+
+    if not is_valid:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect email or password",
@@ -97,6 +108,11 @@ async def login(
             detail="Inactive user"
         )
 
+    # Upgrade legacy (bcrypt) hashes to argon2id while we have the password
+    if new_hash:
+        user.hashed_password = new_hash
+        await db.commit()
+
     # Create access token
     access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
     access_token = create_access_token(
@@ -120,4 +136,5 @@ async def get_me(
         GET /api/v1/auth/me
         Authorization: Bearer <jwt_token>
     """
-    return current_user
+    # Loaded user (often from the auth cache): no need to re-validate it
+    return UserResponse.from_orm_fast(current_user)
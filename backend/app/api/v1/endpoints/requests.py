@@ -7,32 +7,70 @@ Core API for the HITL service:
 - System calls webhooks
 """
 
+import logging
 from datetime import datetime, timedelta
-from typing import List, Optional
+from typing import Any, List, Optional
 from uuid import UUID
 
+import orjson
 from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks, Query
-from sqlalchemy.orm import Session
+from sqlalchemy import Row, Text, cast, func, insert, select, update
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps import get_db, get_current_user, verify_api_key_dependency
-from app.models import ConsultationRequest, User, APIKey, WebhookDelivery
+from app.api.pagination import apply_keyset, next_cursor
+from app.api.responses import FastJSONResponse
+from app.core.config import settings
+from app.models import ConsultationRequest, User, APIKey
 from app.schemas import (
     ConsultationRequestCreate,
     ConsultationRequestResponse,
     ConsultationRequestList,
     HumanResponse,
 )
-from app.core.security import create_webhook_signature
+from app.services.webhooks import call_agent_webhook, enqueue_webhook
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Responses are built straight from columns (response field names are the
+# column names), for single requests (create/get/respond) as well as lists.
+# JSONB columns (context, metadata, response) are fetched as text and
+# embedded in the response as-is (orjson.Fragment): these blobs are opaque
+# to the API, so parsing them into dicts only to serialize them again is
+# wasted work.
+_RESPONSE_FIELDS = tuple(ConsultationRequestResponse.model_fields)
+_JSON_FIELDS = frozenset(
+    name
+    for name in _RESPONSE_FIELDS
+    if isinstance(ConsultationRequest.__table__.c[name].type, JSONB)
+)
+_RESPONSE_COLUMNS = tuple(
+    cast(ConsultationRequest.__table__.c[name], Text).label(name)
+    if name in _JSON_FIELDS
+    else ConsultationRequest.__table__.c[name]
+    for name in _RESPONSE_FIELDS
+)
+
+
+def _response_item(row: Row[Any]) -> dict[str, Any]:
+    """Build one response item from a row of _RESPONSE_COLUMNS."""
+    values = row._mapping
+    item = {name: values[name] for name in _RESPONSE_FIELDS}
+    for name in _JSON_FIELDS:
+        if item[name] is not None:
+            item[name] = orjson.Fragment(item[name])
+    return item
+
 
 @router.post("/", response_model=ConsultationRequestResponse, status_code=201)
 async def create_request(
     request_data: ConsultationRequestCreate,
     background_tasks: BackgroundTasks,
     api_key: APIKey = Depends(verify_api_key_dependency),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ):
     """Create a consultation request (agents only).
 
@@ -58,31 +96,36 @@ async def create_request(
             }
         }
     """
-    # Calculate timeout
+    # Calculate timeout (server-side, so it's on the same clock as the timeout sweep)
     timeout_at = None
     if request_data.timeout_minutes:
-        timeout_at = datetime.utcnow() + timedelta(minutes=request_data.timeout_minutes)
+        timeout_at = func.now() + timedelta(minutes=request_data.timeout_minutes)
 
     # Create request
-    db_request = ConsultationRequest(
-        title=request_data.title,
-        description=request_data.description,
-        context=request_data.context,
-        callback_webhook=str(request_data.callback_webhook) if request_data.callback_webhook else None,
-        callback_secret=request_data.callback_secret,
-        state="pending",
-        timeout_at=timeout_at,
-        metadata=request_data.metadata or {},
-    )
-
-    db.add(db_request)
-    db.commit()
-    db.refresh(db_request)
+    # INSERT ... RETURNING loads the row (including the SQL-computed
+    # timeout_at and server defaults) in the same round-trip
+    row = (
+        await db.execute(
+            insert(ConsultationRequest)
+            .values(
+                title=request_data.title,
+                description=request_data.description,
+                context=request_data.context,
+                callback_webhook=str(request_data.callback_webhook) if request_data.callback_webhook else None,
+                callback_secret=request_data.callback_secret,
+                state="pending",
+                timeout_at=timeout_at,
+                request_metadata=request_data.metadata or {},
+            )
+            .returning(*_RESPONSE_COLUMNS)
+        )
+    ).one()
+    await db.commit()
 
     # TODO: Send notification to humans (email, Slack, etc.)
-    # background_tasks.add_task(send_notification, db_request.id)
+    # background_tasks.add_task(send_notification, row.id)
 
-    return db_request
+    return FastJSONResponse(_response_item(row), status_code=201)
 
 
 @router.get("/", response_model=ConsultationRequestList)
@@ -90,50 +133,85 @@ async def list_requests(
     state: Optional[str] = Query(None, description="Filter by state (pending, responded, etc.)"),
     updated_after: Optional[datetime] = Query(None, description="Only return requests updated after this timestamp (for polling)"),
     limit: int = Query(20, ge=1, le=100, description="Number of results per page"),
-    offset: int = Query(0, ge=0, description="Number of results to skip"),
+    after: Optional[str] = Query(None, description="Cursor from a previous page's next_cursor"),
+    offset: int = Query(0, ge=0, description="Number of results to skip (legacy, prefer `after`)"),
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ):
     """List consultation requests (humans only).
 
     Requires JWT authentication.
 
     Example:
-        GET /api/v1/requests?state=pending&limit=20&offset=0
+        GET /api/v1/requests?state=pending&limit=20
         Authorization: Bearer <jwt_token>
 
+    Next page (keyset pagination - constant cost at any depth):
+        GET /api/v1/requests?state=pending&limit=20&after=<next_cursor>
+
+    When `after` is used, `total` is not computed (returned as null).
+    `offset` is still accepted for backwards compatibility.
+
     For differential polling:
         GET /api/v1/requests?updated_after=2024-01-01T12:00:00Z
     """
-    query = db.query(ConsultationRequest)
+    query = select(*_RESPONSE_COLUMNS)
 
     # Filter by state if provided
     if state:
-        query = query.filter(ConsultationRequest.state == state)
+        query = query.where(ConsultationRequest.state == state)
 
     # Filter by updated_after for differential polling
     if updated_after:
-        query = query.filter(ConsultationRequest.updated_at > updated_after)
-
-    # Get total count
-    total = query.count()
-
-    # Get paginated results
-    requests = query.order_by(ConsultationRequest.created_at.desc()).offset(offset).limit(limit).all()
-
-    return {
-        "items": requests,
-        "total": total,
-        "limit": limit,
-        "offset": offset,
-    }
+        query = query.where(ConsultationRequest.updated_at > updated_after)
+
+    if after:
+        # Keyset pagination: seek past the cursor, no OFFSET and no COUNT
+        rows = (
+            await db.execute(apply_keyset(query, ConsultationRequest, after).limit(limit))
+        ).all()
+        total = None
+    else:
+        # Legacy offset pagination, with the total count as a window column
+        # (one round-trip instead of a separate COUNT query)
+        rows = (
+            await db.execute(
+                apply_keyset(
+                    query.add_columns(func.count().over().label("total")),
+                    ConsultationRequest,
+                    None,
+                )
+                .offset(offset)
+                .limit(limit)
+            )
+        ).all()
+
+        if rows:
+            total = rows[0].total
+        elif offset == 0:
+            total = 0
+        else:
+            # Page is past the end - no rows to read the window count from
+            total = await db.scalar(select(func.count()).select_from(query.subquery()))
+
+    # Rows come from the DB: encode them directly, without Pydantic
+    # validation/serialization (the response_model only documents the shape)
+    return FastJSONResponse(
+        {
+            "items": [_response_item(row) for row in rows],
+            "total": total,
+            "limit": limit,
+            "offset": offset,
+            "next_cursor": next_cursor(rows, limit),
+        }
+    )
 
 
 @router.get("/{request_id}", response_model=ConsultationRequestResponse)
 async def get_request(
     request_id: UUID,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ):
     """Get a specific consultation request (humans only).
 
@@ -141,12 +219,16 @@ async def get_request(
         GET /api/v1/requests/550e8400-e29b-41d4-a716-446655440000
         Authorization: Bearer <jwt_token>
     """
-    request = db.query(ConsultationRequest).filter(ConsultationRequest.id == request_id).first()
+    row = (
+        await db.execute(
+            select(*_RESPONSE_COLUMNS).where(ConsultationRequest.id == request_id)
+        )
+    ).one_or_none()
 
-    if not request:
+    if row is None:
         raise HTTPException(status_code=404, detail="Request not found")
 
-    return request
+    return FastJSONResponse(_response_item(row))
 
 
 @router.post("/{request_id}/respond", response_model=ConsultationRequestResponse)
@@ -155,7 +237,7 @@ async def respond_to_request(
     response: HumanResponse,
     background_tasks: BackgroundTasks,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ):
     """Submit a response to a consultation request (humans only).
 
@@ -172,113 +254,58 @@ async def respond_to_request(
     - Updates request state to "responded"
     - Calls webhook asynchronously
     """
-    request = db.query(ConsultationRequest).filter(ConsultationRequest.id == request_id).first()
+    # Update request with response
+    # Conditional UPDATE ... RETURNING: only a pending request can be answered,
+    # and the updated row (with its server-side values) comes back in the
+    # same round-trip.
+    # Timestamps come from the database: now() is fixed for the transaction,
+    # so response.responded_at and the responded_at column are identical.
+    request = (
+        await db.execute(
+            update(ConsultationRequest)
+            .where(
+                ConsultationRequest.id == request_id,
+                ConsultationRequest.state == "pending",
+            )
+            .values(
+                response=func.jsonb_build_object(
+                    "decision", response.decision,
+                    "comment", response.comment,
+                    "responder_id", str(current_user.id),
+                    "responded_at", func.now(),
+                ),
+                responded_by=current_user.id,
+                responded_at=func.now(),
+                state="responded",
+            )
+            .returning(*_RESPONSE_COLUMNS, ConsultationRequest.callback_webhook)
+        )
+    ).one_or_none()
 
-    if not request:
-        raise HTTPException(status_code=404, detail="Request not found")
+    if request is None:
+        # Nothing updated - find out why
+        existing = await db.get(ConsultationRequest, request_id)
+        if not existing:
+            raise HTTPException(status_code=404, detail="Request not found")
 
-    if request.state != "pending":
         raise HTTPException(
             status_code=400,
-            detail=f"Request is already {request.state}, cannot respond"
+            detail=f"Request is already {existing.state}, cannot respond"
         )
 
-    # Update request with response
-    request.response = {
-        "decision": response.decision,
-        "comment": response.comment,
-        "responder_id": str(current_user.id),
-        "responded_at": datetime.utcnow().isoformat(),
-    }
-    request.responded_by = current_user.id
-    request.responded_at = datetime.utcnow()
-    request.state = "responded"
-
-    db.commit()
-    db.refresh(request)
+    await db.commit()
 
     # Call webhook in background
+    # (the task opens its own session - the request session is closed by then)
     if request.callback_webhook:
-        background_tasks.add_task(call_agent_webhook, request.id, db)
-
-    return request
-
-
-async def call_agent_webhook(request_id: UUID, db: Session):
-    """Background task to call agent's webhook.
-
-    Retries up to 3 times with exponential backoff.
-    """
-    import httpx
-    import asyncio
-
-    request = db.query(ConsultationRequest).filter(ConsultationRequest.id == request_id).first()
-    if not request or not request.callback_webhook:
-        return
-
-    # Build payload
-    payload = {
-        "event": "request.responded",
-        "request_id": str(request.id),
-        "metadata": request.metadata or {},
-        "response": request.response,
-    }
-
-    # Create signature if secret provided
-    headers = {"Content-Type": "application/json"}
-    if request.callback_secret:
-        signature = create_webhook_signature(payload, request.callback_secret)
-        headers["X-Webhook-Signature"] = signature
-
-    # Retry logic
-    max_retries = 3
-    for attempt in range(max_retries):
-        try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.post(
-                    request.callback_webhook,
-                    json=payload,
-                    headers=headers,
-                )
-                response.raise_for_status()
-
-                # Log successful delivery
-                delivery = WebhookDelivery(
-                    request_id=request.id,
-                    webhook_url=request.callback_webhook,
-                    payload=payload,
-                    status_code=response.status_code,
-                    response_body=response.text[:1000],  # Limit size
-                    retry_count=attempt,
-                )
-                db.add(delivery)
-
-                # Update request state
-                request.state = "callback_sent"
-                request.callback_sent_at = datetime.utcnow()
-                db.commit()
-
-                return  # Success!
-
-        except Exception as e:
-            error_msg = str(e)
-
-            # Log failed delivery
-            delivery = WebhookDelivery(
-                request_id=request.id,
-                webhook_url=request.callback_webhook,
-                payload=payload,
-                status_code=None,
-                error=error_msg[:1000],
-                retry_count=attempt,
-            )
-            db.add(delivery)
-            db.commit()
-
-            if attempt < max_retries - 1:
-                # Exponential backoff: 2s, 4s, 8s
-                await asyncio.sleep(2 ** attempt)
-            else:
-                # Final failure
-                request.state = "callback_failed"
-                db.commit()
+        if settings.WEBHOOK_QUEUE_ENABLED:
+            try:
+                await enqueue_webhook(request.id)
+            except Exception:
+                # Response is already committed - don't lose the webhook
+                logger.exception(f"Failed to queue webhook for request {request.id}")
+                background_tasks.add_task(call_agent_webhook, request.id)
+        else:
+            background_tasks.add_task(call_agent_webhook, request.id)
+
+    return FastJSONResponse(_response_item(request))
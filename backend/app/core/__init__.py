@@ -1,5 +1,5 @@
 """Core application modules."""
 
-from app.core.config import settings
+from app.core.config import get_settings, settings
 
-__all__ = ["settings"]
+__all__ = ["get_settings", "settings"]
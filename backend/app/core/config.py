@@ -7,10 +7,11 @@ This module demonstrates production-ready configuration management:
 4. Secrets management ready
 """
 
-from typing import List
+from functools import lru_cache
+from typing import List, Literal
 
-from pydantic import PostgresDsn, validator
-from pydantic_settings import BaseSettings
+from pydantic import PostgresDsn, field_validator
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
 class Settings(BaseSettings):
@@ -21,6 +22,8 @@ class Settings(BaseSettings):
     immediately rather than at runtime.
     """
 
+    model_config = SettingsConfigDict(env_file=".env", case_sensitive=True)
+
     # Application
     APP_NAME: str = "Glitch Forge HITL API"
     VERSION: str = "0.1.0"
@@ -35,19 +38,34 @@ class Settings(BaseSettings):
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
     REFRESH_TOKEN_EXPIRE_DAYS: int = 7
+    JWT_CACHE_TTL: int = 5  # Seconds a verified token payload is reused
+    JWT_CACHE_MAX: int = 10_000  # Max cached token payloads (per worker)
+    PASSWORD_HASH_WORKERS: int = 2  # Hashing processes per worker (each argon2 hash uses 64 MiB)
 
     # Database
     DATABASE_URL: PostgresDsn
 
+    # Connection pool (per worker process)
+    DB_POOL_SIZE: int = 20  # Persistent connections kept open
+    DB_MAX_OVERFLOW: int = 10  # Extra connections allowed under burst load
+    DB_POOL_TIMEOUT: int = 30  # Seconds to wait for a free connection
+    DB_POOL_RECYCLE: int = 1800  # Recycle connections older than this (seconds)
+    DB_STATEMENT_CACHE_SIZE: int = 500  # Prepared statements cached per connection (0 behind PgBouncer)
+
     # Redis
     REDIS_URL: str
 
+    # Webhooks
+    # False: deliver from the API process (FastAPI background task)
+    # True: queue on a Redis stream for app.workers.webhook_worker
+    WEBHOOK_QUEUE_ENABLED: bool = False
+
     # CORS
     CORS_ORIGINS: List[str] = ["http://localhost:3000", "http://localhost:5173"]
 
     # Email Configuration
     EMAIL_ENABLED: bool = False  # Set to True to enable email notifications
-    EMAIL_PROVIDER: str = "resend"  # "resend" or "sendgrid"
+    EMAIL_PROVIDER: Literal["resend", "sendgrid"] = "resend"  # Case-insensitive in env
 
     # Resend settings
     RESEND_API_KEY: str = ""
@@ -60,18 +78,31 @@ class Settings(BaseSettings):
     # Frontend URL (for email links)
     FRONTEND_URL: str = "http://localhost:3000"
 
-    @validator("CORS_ORIGINS", pre=True)
+    @field_validator("CORS_ORIGINS", mode="before")
+    @classmethod
     def parse_cors_origins(cls, v: str | List[str]) -> List[str]:
         """Parse CORS origins from string or list."""
         if isinstance(v, str):
             return [origin.strip() for origin in v.split(",")]
         return v
 
-    class Config:
-        """Pydantic configuration."""
-        env_file = ".env"
-        case_sensitive = True
+    @field_validator("EMAIL_PROVIDER", mode="before")
+    @classmethod
+    def normalize_email_provider(cls, v: str) -> str:
+        """Lower-case the provider name, so typos fail at startup, not on first email."""
+        return v.lower() if isinstance(v, str) else v
+
+
+@lru_cache
+def get_settings() -> Settings:
+    """Return the process-wide Settings (environment is parsed only once).
+
+    Usable as a FastAPI dependency: `settings: Settings = Depends(get_settings)`.
+    Tests can override it, or call `get_settings.cache_clear()` after changing
+    the environment.
+    """
+    return Settings()
 
 
 # Global settings instance
-settings = Settings()
+settings = get_settings()
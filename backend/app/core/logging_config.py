@@ -5,22 +5,58 @@ Production-ready logging with:
 2. Different log levels per environment
 3. Request ID tracking
 4. Performance monitoring
+
+Logging runs inline on the event loop, so the hot path is kept cheap:
+records are serialized with orjson, and the actual stdout write happens on a
+background thread (QueueHandler -> QueueListener).
 """
 
+import atexit
 import logging
+import queue
 import sys
-from typing import Any, Dict
+import time
+from functools import lru_cache
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Dict, Optional
+
+import orjson
 
 from app.core.config import settings
 
+_listener: Optional[QueueListener] = None
+
+
+def _stop_listener() -> None:
+    """Flush and stop the current listener thread, if any (safe to call twice)."""
+    global _listener
+
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+# Registered once; setup_logging() may run (and replace the listener) many times
+atexit.register(_stop_listener)
+
+
+@lru_cache(maxsize=4)
+def _format_seconds(seconds: int) -> str:
+    """Format a Unix timestamp (whole seconds) - cached, most records share one."""
+    return time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(seconds))
+
 
 class StructuredFormatter(logging.Formatter):
     """Custom formatter for structured logging."""
 
     def format(self, record: logging.LogRecord) -> str:
         """Format log record as structured data."""
+        # In development, use human-readable format
+        if settings.ENVIRONMENT == "development":
+            return f"[{record.levelname}] {record.name}: {record.getMessage()}"
+
         log_data: Dict[str, Any] = {
-            "timestamp": self.formatTime(record, self.datefmt),
+            "timestamp": f"{_format_seconds(int(record.created))},{int(record.msecs):03d}",
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
@@ -34,23 +70,30 @@ class StructuredFormatter(logging.Formatter):
         if hasattr(record, "request_id"):
             log_data["request_id"] = record.request_id
 
-        # In development, use human-readable format
-        if settings.ENVIRONMENT == "development":
-            return f"[{log_data['level']}] {log_data['logger']}: {log_data['message']}"
-
         # In production, use JSON for log aggregators
-        import json
-        return json.dumps(log_data)
+        return orjson.dumps(log_data, default=str).decode()
 
 
 def setup_logging() -> None:
     """Configure application logging."""
+    global _listener
+
     log_level = logging.DEBUG if settings.DEBUG else logging.INFO
 
-    # Create handler
-    handler = logging.StreamHandler(sys.stdout)
+    # Records are formatted by the QueueHandler (in the calling thread) and
+    # written to stdout by the listener thread, so a slow stdout/pipe never
+    # blocks the event loop.
+    log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    handler = QueueHandler(log_queue)
     handler.setFormatter(StructuredFormatter())
 
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(logging.Formatter("%(message)s"))
+
+    _stop_listener()
+    _listener = QueueListener(log_queue, stream_handler)
+    _listener.start()
+
     # Configure root logger
     logging.basicConfig(
         level=log_level,
@@ -1,31 +1,61 @@
 """Security utilities for authentication and authorization.
 
 Provides:
-1. Password hashing/verification (bcrypt)
+1. Password hashing/verification (argon2id, bcrypt for older hashes)
 2. JWT token creation/validation
 3. API key hashing/verification
 """
 
+import asyncio
 import hashlib
+import hmac
+import multiprocessing
 import secrets
-from datetime import datetime, timedelta
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from typing import Any, Optional
+from uuid import UUID, uuid4
 
-from jose import JWTError, jwt
+import jwt
+import orjson
+from cachetools import TLRUCache
 from passlib.context import CryptContext
 
 from app.core.config import settings
 
-# Password hashing context (bcrypt)
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Password hashing context
+# New hashes use argon2id (64 MiB, 2 passes, 4 lanes: ~30-50ms instead of
+# ~250ms for bcrypt cost 12). Existing bcrypt hashes still verify and are
+# upgraded to argon2id on the next successful login.
+pwd_context = CryptContext(
+    schemes=["argon2", "bcrypt"],
+    deprecated=["bcrypt"],
+    argon2__type="ID",
+    argon2__memory_cost=65536,
+    argon2__time_cost=2,
+    argon2__parallelism=4,
+)
+
+# Password hashing is deliberately slow. Running it inside an async handler
+# would block the event loop for every other request, so the async helpers
+# below run it in a process pool instead.
+# "spawn" avoids forking a process that has a running event loop and threads.
+# Every uvicorn worker gets its own pool, so keep it small
+# (workers × PASSWORD_HASH_WORKERS processes in total).
+_HASH_POOL = ProcessPoolExecutor(
+    max_workers=settings.PASSWORD_HASH_WORKERS,
+    mp_context=multiprocessing.get_context("spawn"),
+)
 
 
 def hash_password(password: str) -> str:
-    """Hash a password using bcrypt.
+    """Hash a password using argon2id.
 
     Example:
         hashed = hash_password("MySecurePassword123")
-        # Returns: $2b$12$... (60 chars)
+        # Returns: $argon2id$v=19$m=65536,t=2,p=4$... (~97 chars)
     """
     return pwd_context.hash(password)
 
@@ -40,6 +70,55 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
 
 
+def verify_and_update_password(
+    plain_password: str, hashed_password: str
+) -> tuple[bool, Optional[str]]:
+    """Verify a password and rehash it if it uses outdated settings.
+
+    Returns:
+        (is_valid, new_hash) - new_hash is None unless the stored hash
+        should be replaced (e.g. a bcrypt hash after a successful login)
+    """
+    return pwd_context.verify_and_update(plain_password, hashed_password)
+
+
+async def hash_password_async(password: str) -> str:
+    """Hash a password without blocking the event loop.
+
+    Example:
+        hashed = await hash_password_async("MySecurePassword123")
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_HASH_POOL, hash_password, password)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """Verify a password without blocking the event loop.
+
+    Example:
+        is_valid = await verify_password_async("MySecurePassword123", hashed)
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _HASH_POOL, verify_password, plain_password, hashed_password
+    )
+
+
+async def verify_and_update_password_async(
+    plain_password: str, hashed_password: str
+) -> tuple[bool, Optional[str]]:
+    """verify_and_update_password without blocking the event loop."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _HASH_POOL, verify_and_update_password, plain_password, hashed_password
+    )
+
+
+def shutdown_password_hashing() -> None:
+    """Stop the password hashing worker processes (called on app shutdown)."""
+    _HASH_POOL.shutdown(wait=False, cancel_futures=True)
+
+
 def create_access_token(data: dict[str, Any], expires_delta: Optional[timedelta] = None) -> str:
     """Create a JWT access token.
 
@@ -59,18 +138,33 @@ def create_access_token(data: dict[str, Any], expires_delta: Optional[timedelta]
     to_encode = data.copy()
 
     if expires_delta:
-        expire = datetime.utcnow() + expires_delta
+        expire = datetime.now(timezone.utc) + expires_delta
     else:
-        expire = datetime.utcnow() + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+        expire = datetime.now(timezone.utc) + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
 
-    to_encode.update({"exp": expire})
+    # jti gives each token a unique ID (used as the auth cache key in deps)
+    to_encode.update({"exp": expire, "jti": uuid4().hex})
     encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
     return encoded_jwt
 
 
+# Verified JWT payloads, keyed by SHA256(token).
+# An entry lives JWT_CACHE_TTL seconds but never past the token's own exp, so
+# an expired token is never accepted from cache. Failures are not cached.
+# Only used from the event loop thread, so no lock is needed.
+_token_cache: TLRUCache = TLRUCache(
+    maxsize=settings.JWT_CACHE_MAX,
+    ttu=lambda _key, payload, now: min(now + settings.JWT_CACHE_TTL, payload.get("exp", now)),
+    timer=time.time,
+)
+
+
 def verify_token(token: str) -> Optional[dict[str, Any]]:
     """Verify and decode a JWT token.
 
+    Repeated calls with the same token within JWT_CACHE_TTL seconds skip
+    signature verification and return the cached payload.
+
     Args:
         token: JWT token string
 
@@ -82,44 +176,93 @@ def verify_token(token: str) -> Optional[dict[str, Any]]:
         if payload:
             user_id = payload.get("sub")
     """
+    cache_key = hashlib.sha256(token.encode()).digest()
+    payload = _token_cache.get(cache_key)
+    if payload is not None:
+        return payload
+
     try:
         payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
-        return payload
-    except JWTError:
+    except jwt.PyJWTError:
         return None
 
+    _token_cache[cache_key] = payload
+    return payload
+
+
+# Prefix for API keys in the "gf_<key id>.<secret>" format
+API_KEY_PREFIX = "gf_"
+
 
-def generate_api_key() -> str:
-    """Generate a secure random API key.
+def generate_api_key(key_id: UUID) -> str:
+    """Generate a secure random API key for the given APIKey row ID.
+
+    The key embeds the row ID so verification is a primary-key lookup
+    followed by a hash comparison (no index scan on key_hash).
 
     Returns:
-        URL-safe random string (~43 characters)
+        "gf_<key id>.<URL-safe random secret>" (~83 characters)
 
     Example:
-        key = generate_api_key()
-        # Returns: "hKj8sH3nX92lP4mN6vB1qW0zR5tY7u..."
+        key = generate_api_key(api_key_id)
+        # Returns: "gf_01932c4e-...-7b3a.hKj8sH3nX92lP4mN6vB1qW0zR5tY7u..."
         # SHOW THIS TO USER ONCE!
     """
-    return secrets.token_urlsafe(32)
+    return f"{API_KEY_PREFIX}{key_id}.{secrets.token_urlsafe(32)}"
+
+
+def parse_api_key_id(api_key: str) -> Optional[UUID]:
+    """Extract the APIKey row ID from a raw key.
+
+    Returns:
+        The embedded UUID, or None for legacy keys (plain random strings)
+    """
+    if not api_key.startswith(API_KEY_PREFIX):
+        return None
+
+    key_id, sep, _secret = api_key[len(API_KEY_PREFIX):].partition(".")
+    if not sep:
+        return None
+
+    try:
+        return UUID(key_id)
+    except ValueError:
+        return None
 
 
-def hash_api_key(api_key: str) -> str:
+def hash_api_key(api_key: str) -> bytes:
     """Hash an API key for storage.
 
     Args:
         api_key: Raw API key string
 
     Returns:
-        SHA256 hex digest (64 characters)
+        SHA256 digest (32 raw bytes, stored as BYTEA)
 
     Example:
         key_hash = hash_api_key(raw_key)
         # Store key_hash in database
+
+    hashlib.sha256 runs in OpenSSL, which uses the CPU's SHA extensions
+    (SHA-NI / ARMv8 SHA2) when available - no configuration needed. For a
+    ~60-byte key the Python call overhead dominates, hence the cached
+    variant below for the per-request path.
+    """
+    return hashlib.sha256(api_key.encode()).digest()
+
+
+@lru_cache(maxsize=4096)
+def hash_api_key_cached(api_key: str) -> bytes:
+    """hash_api_key, memoized for the per-request auth path.
+
+    Agents send the same key on every call, so most lookups are a dict hit.
+    Keys are high-entropy secrets, so the cache can't be used to probe for
+    hashes of guessable inputs; random bad keys just cycle out of the LRU.
     """
-    return hashlib.sha256(api_key.encode()).hexdigest()
+    return hash_api_key(api_key)
 
 
-def verify_api_key(api_key: str, key_hash: str) -> bool:
+def verify_api_key(api_key: str, key_hash: bytes) -> bool:
     """Verify an API key against its hash.
 
     Args:
@@ -132,7 +275,36 @@ def verify_api_key(api_key: str, key_hash: str) -> bool:
     Example:
         is_valid = verify_api_key(incoming_key, stored_hash)
     """
-    return hash_api_key(api_key) == key_hash
+    # Constant-time comparison (== would leak the matching prefix length via timing)
+    return hmac.compare_digest(hash_api_key_cached(api_key), key_hash)
+
+
+# Scheme prefix of the X-Webhook-Signature header value
+_HMAC_PREFIX = "sha256="
+
+
+def encode_webhook_payload(payload: dict[str, Any]) -> bytes:
+    """Serialize a webhook payload to the exact bytes that are signed and sent.
+
+    Compact, key-sorted JSON: the same payload always yields the same bytes.
+    """
+    return orjson.dumps(payload, option=orjson.OPT_SORT_KEYS)
+
+
+def sign_webhook_body(body: bytes, secret: str) -> str:
+    """Create the HMAC signature header value for an encoded webhook body.
+
+    Args:
+        body: Encoded payload (see encode_webhook_payload)
+        secret: Shared secret with agent
+
+    Returns:
+        Signature string in format "sha256=<hex>"
+    """
+    # One-shot hmac.digest() runs entirely in OpenSSL (no Python HMAC object)
+    signature = hmac.digest(secret.encode(), body, "sha256").hex()
+
+    return _HMAC_PREFIX + signature
 
 
 def create_webhook_signature(payload: dict[str, Any], secret: str) -> str:
@@ -150,17 +322,7 @@ def create_webhook_signature(payload: dict[str, Any], secret: str) -> str:
         # Returns: "sha256=abcdef123456..."
         # Include in X-Webhook-Signature header
     """
-    import json
-    import hmac
-
-    payload_bytes = json.dumps(payload, separators=(',', ':')).encode()
-    signature = hmac.new(
-        secret.encode(),
-        payload_bytes,
-        hashlib.sha256
-    ).hexdigest()
-
-    return f"sha256={signature}"
+    return sign_webhook_body(encode_webhook_payload(payload), secret)
 
 
 def verify_webhook_signature(payload: dict[str, Any], signature: str, secret: str) -> bool:
@@ -177,7 +339,5 @@ def verify_webhook_signature(payload: dict[str, Any], signature: str, secret: st
     Example:
         is_valid = verify_webhook_signature(payload, request_signature, secret)
     """
-    import hmac
-
     expected_signature = create_webhook_signature(payload, secret)
     return hmac.compare_digest(signature, expected_signature)
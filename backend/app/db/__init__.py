@@ -1,6 +1,6 @@
 """Database package."""
 
 from app.db.base import Base
-from app.db.session import SessionLocal, engine, get_db
+from app.db.session import AsyncSessionLocal, engine, get_db
 
-__all__ = ["Base", "SessionLocal", "engine", "get_db"]
+__all__ = ["Base", "AsyncSessionLocal", "engine", "get_db"]
@@ -7,6 +7,7 @@ Key Concepts:
 - Mixins: Reusable functionality shared across models
 """
 
+import re
 from typing import Any
 
 from sqlalchemy.ext.declarative import declared_attr
@@ -14,6 +15,10 @@ from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 from sqlalchemy import DateTime, func
 from datetime import datetime
 
+# CamelCase -> snake_case, used by Base.__tablename__
+_CAMEL_WORD = re.compile(r"(.)([A-Z][a-z]+)")
+_CAMEL_BOUNDARY = re.compile(r"([a-z0-9])([A-Z])")
+
 
 class Base(DeclarativeBase):
     """Base class for all database models.
@@ -24,16 +29,34 @@ class Base(DeclarativeBase):
     - Helper methods
     """
 
+    # Fetch server-generated values (created_at, updated_at onupdate, columns
+    # set to SQL expressions like func.now()) with RETURNING as part of the
+    # INSERT/UPDATE itself, so objects are fully loaded after commit without
+    # a follow-up db.refresh() SELECT.
+    __mapper_args__ = {"eager_defaults": True}
+
     # Generate __tablename__ automatically from class name
     # Example: UserModel -> user_model
     @declared_attr.directive
     def __tablename__(cls) -> str:
         """Generate table name from class name."""
         # Convert CamelCase to snake_case
-        import re
-
-        name = re.sub("(.)([A-Z][a-z]+)", r"\1_\2", cls.__name__)
-        return re.sub("([a-z0-9])([A-Z])", r"\1_\2", name).lower()
+        name = _CAMEL_WORD.sub(r"\1_\2", cls.__name__)
+        return _CAMEL_BOUNDARY.sub(r"\1_\2", name).lower()
+
+    @classmethod
+    def _dict_fields(cls) -> tuple[tuple[str, str], ...]:
+        """(column name, attribute key) pairs for dict(), computed once per class."""
+        fields = cls.__dict__.get("_dict_field_cache")
+        if fields is None:
+            # Column name and attribute key differ when a column is mapped
+            # under another name, e.g. ConsultationRequest.request_metadata
+            # -> "metadata"
+            fields = tuple(
+                (prop.columns[0].name, prop.key) for prop in cls.__mapper__.column_attrs
+            )
+            cls._dict_field_cache = fields
+        return fields
 
     def dict(self) -> dict[str, Any]:
         """Convert model to dictionary.
@@ -43,10 +66,7 @@ class Base(DeclarativeBase):
         - Serialization
         - Logging
         """
-        return {
-            column.name: getattr(self, column.name)
-            for column in self.__table__.columns
-        }
+        return {name: getattr(self, key) for name, key in self._dict_fields()}
 
 
 class TimestampMixin:
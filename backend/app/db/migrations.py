@@ -0,0 +1,83 @@
+"""Helpers for online (zero-downtime) Alembic migrations.
+
+Alembic runs each migration inside a transaction. That's fine for creating
+tables, but on a populated database two things hurt:
+
+1. A plain CREATE INDEX locks the table against writes for the whole build.
+   CREATE INDEX CONCURRENTLY doesn't, but it can't run inside a transaction,
+   so it has to go in an autocommit block.
+2. A data backfill done as one giant UPDATE holds row locks and builds up
+   WAL until it commits. Updating in small batches (20-100 rows) with a
+   commit per batch keeps locks short and lets replicas keep up.
+
+Usage in a migration:
+    from app.db.migrations import create_index_concurrently
+
+    def upgrade() -> None:
+        create_index_concurrently(
+            "ix_cr_state_created_at", "consultation_requests", "state, created_at DESC"
+        )
+"""
+
+from typing import Optional
+
+import sqlalchemy as sa
+from alembic import op
+
+
+def create_index_concurrently(
+    name: str,
+    table: str,
+    columns: str,
+    where: Optional[str] = None,
+    using: Optional[str] = None,
+) -> None:
+    """Build an index without blocking writes to the table.
+
+    Args:
+        name: Index name
+        table: Table name
+        columns: Column list as SQL, e.g. "state, created_at DESC"
+        where: Optional predicate for a partial index
+        using: Optional index method, e.g. "gin"
+
+    Note: if a concurrent build fails it leaves an INVALID index behind.
+    Drop it (drop_index_concurrently) before re-running the migration.
+    """
+    method = f" USING {using}" if using else ""
+    sql = f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} ON {table}{method} ({columns})"
+    if where:
+        sql += f" WHERE {where}"
+
+    with op.get_context().autocommit_block():
+        op.execute(sql)
+
+
+def drop_index_concurrently(name: str) -> None:
+    """Drop an index without blocking writes to its table."""
+    with op.get_context().autocommit_block():
+        op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
+
+
+def execute_in_batches(sql: str, batch_size: int = 100) -> None:
+    """Run a data migration statement repeatedly until it touches no rows.
+
+    `sql` must limit itself to `:batch_size` rows per run and skip rows it
+    has already migrated, e.g.:
+
+        UPDATE consultation_requests SET priority = 'normal'
+        WHERE id IN (
+            SELECT id FROM consultation_requests
+            WHERE priority IS NULL
+            LIMIT :batch_size
+        )
+
+    Each batch is committed on its own (autocommit), so locks are held only
+    for one batch at a time.
+    """
+    statement = sa.text(sql).bindparams(batch_size=batch_size)
+
+    with op.get_context().autocommit_block():
+        bind = op.get_bind()
+        while bind.execute(statement).rowcount:
+            pass
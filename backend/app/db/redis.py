@@ -0,0 +1,37 @@
+"""Redis client.
+
+One shared asyncio Redis client per process (it keeps its own connection
+pool), created on first use from settings.REDIS_URL.
+
+Usage:
+    from app.db.redis import get_redis
+
+    redis = get_redis()
+    await redis.xadd("webhooks", {"request_id": "..."})
+"""
+
+from typing import Optional
+
+from redis.asyncio import Redis
+
+from app.core.config import settings
+
+_redis: Optional[Redis] = None
+
+
+def get_redis() -> Redis:
+    """Return the shared Redis client, creating it on first use."""
+    global _redis
+
+    if _redis is None:
+        _redis = Redis.from_url(settings.REDIS_URL, decode_responses=True)
+    return _redis
+
+
+async def close_redis() -> None:
+    """Close the shared Redis client (called on shutdown)."""
+    global _redis
+
+    if _redis is not None:
+        await _redis.aclose()
+        _redis = None
@@ -1,48 +1,75 @@
 """Database session management.
 
 This module provides:
-1. Database engine creation
-2. Session factory
+1. Async database engine creation (asyncpg driver)
+2. Async session factory
 3. Dependency injection for FastAPI
 
 Key Concepts:
 - Engine: The connection pool to the database
-- SessionLocal: Factory for creating database sessions
-- Session: Individual database connection (opened per request, closed after)
+- AsyncSessionLocal: Factory for creating async database sessions
+- AsyncSession: Individual database connection (opened per request, closed after)
+
+Why async?
+Route handlers are `async def`, so a sync Session would block the event loop
+on every query. With AsyncSession, DB I/O is awaited and the event loop can
+serve other requests (and webhook calls) in the meantime.
 """
 
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, Session
-from typing import Generator
+from typing import AsyncGenerator
+
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
 from app.core.config import settings
 
+# DATABASE_URL is a plain postgresql:// DSN (Alembic uses it with psycopg2),
+# so swap in the asyncpg driver for the application engine.
+ASYNC_DATABASE_URL = make_url(str(settings.DATABASE_URL)).set(drivername="postgresql+asyncpg")
+
 # Create database engine
 # echo=True in development shows SQL queries (great for learning!)
-engine = create_engine(
-    str(settings.DATABASE_URL),
+engine = create_async_engine(
+    ASYNC_DATABASE_URL,
     echo=settings.DEBUG,  # Log SQL queries in debug mode
     pool_pre_ping=True,  # Verify connections before using (handles disconnects)
-    pool_size=5,  # Connection pool size
-    max_overflow=10,  # Allow 10 extra connections if pool is full
+    pool_size=settings.DB_POOL_SIZE,  # Connection pool size
+    max_overflow=settings.DB_MAX_OVERFLOW,  # Extra connections if pool is full
+    pool_timeout=settings.DB_POOL_TIMEOUT,  # Wait this long for a connection, then error
+    pool_recycle=settings.DB_POOL_RECYCLE,  # Avoid server/LB idle-timeout resets
+    # Hand out the most recently returned connection first: under light load
+    # a few warm connections serve everything and the rest idle out, instead
+    # of round-robining over the whole pool
+    pool_use_lifo=True,
+    # Multi-row INSERTs (ORM flushes of many objects) are sent as batched
+    # INSERT ... VALUES (...), (...) statements of up to this many rows
+    insertmanyvalues_page_size=1000,
+    # Each pooled connection keeps its prepared statements, so a query that
+    # was already run on it skips the Parse round-trip. Sized to hold every
+    # distinct statement the app issues. Both caches must be 0 behind
+    # PgBouncer in transaction mode (see README).
+    connect_args={
+        "prepared_statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,  # SQLAlchemy adapter
+        "statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,  # asyncpg
+    },
 )
 
 # Session factory
-# Creates new Session objects
-SessionLocal = sessionmaker(
-    autocommit=False,  # Don't auto-commit (we control transactions)
-    autoflush=False,  # Don't auto-flush (we control when to write)
+# Creates new AsyncSession objects
+AsyncSessionLocal = async_sessionmaker(
     bind=engine,
+    autoflush=False,  # Don't auto-flush (we control when to write)
+    expire_on_commit=False,  # Keep attributes loaded after commit (no implicit async I/O)
 )
 
 
-def get_db() -> Generator[Session, None, None]:
+async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """FastAPI dependency for database sessions.
 
     Usage in route handlers:
         @app.get("/items")
-        async def read_items(db: Session = Depends(get_db)):
-            items = db.query(Item).all()
+        async def read_items(db: AsyncSession = Depends(get_db)):
+            items = (await db.scalars(select(Item))).all()
             return items
 
     How it works:
@@ -53,10 +80,7 @@ def get_db() -> Generator[Session, None, None]:
     This ensures:
     - No connection leaks
     - Proper transaction handling
-    - Thread safety (each request gets its own session)
+    - Each request gets its own session
     """
-    db = SessionLocal()
-    try:
+    async with AsyncSessionLocal() as db:
         yield db
-    finally:
-        db.close()
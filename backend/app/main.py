@@ -13,12 +13,20 @@ import logging
 from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 
-from fastapi import FastAPI
+import orjson
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 
+from app.api.v1.api import api_router
 from app.core.config import settings
 from app.core.logging_config import setup_logging
+from app.core.security import shutdown_password_hashing
+from app.db.redis import close_redis
+from app.services import auth_cache, webhook_audit
+from app.services.email import close_email_provider
+from app.services.email import dispatcher as email_dispatcher
+from app.services.webhooks import close_webhook_client
 
 # Setup logging
 setup_logging()
@@ -37,15 +45,28 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     logger.info(f"Environment: {settings.ENVIRONMENT}")
 
     # TODO: Initialize database connection pool
-    # TODO: Initialize Redis connection
     # TODO: Run database migrations (optional)
+    await webhook_audit.start()
+    await email_dispatcher.start()
+    await auth_cache.start()  # Listen for auth cache invalidations from other workers
+
+    if not settings.DEBUG:
+        # Build the OpenAPI schema now (FastAPI caches it) so the first
+        # /openapi.json request doesn't pay for introspecting every route
+        app.openapi()
 
     yield
 
     # Shutdown
     logger.info("Shutting down application")
+    await auth_cache.stop()
+    await close_webhook_client()
+    await email_dispatcher.stop()  # Send queued notification emails
+    await close_email_provider()
+    await webhook_audit.stop()  # Flush pending webhook audit records
+    shutdown_password_hashing()
+    await close_redis()
     # TODO: Close database connections
-    # TODO: Close Redis connections
 
 
 # Create FastAPI application
@@ -54,6 +75,8 @@ app = FastAPI(
     version=settings.VERSION,
     description="Human-in-the-Loop API for Agent Consultation",
     lifespan=lifespan,
+    # Routes that return plain data are encoded with orjson, not json.dumps
+    default_response_class=ORJSONResponse,
     # Disable docs in production for security
     docs_url="/docs" if settings.DEBUG else None,
     redoc_url="/redoc" if settings.DEBUG else None,
@@ -64,13 +87,36 @@ app.add_middleware(
     CORSMiddleware,
     allow_origins=settings.CORS_ORIGINS,
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    # Only what the frontend sends. With "*" Starlette echoes back whatever
+    # a preflight asks for; explicit lists are checked against fixed sets.
+    allow_methods=["GET", "POST", "PATCH"],
+    allow_headers=["Authorization", "Content-Type"],
+    # Let the dashboard read the API key list's pagination cursor
+    expose_headers=["X-Next-Cursor"],
+)
+
+
+# /health and / only return settings, which never change while the process
+# runs, so their bodies are encoded once here instead of on every call
+# (load balancers probe /health every few seconds)
+_HEALTH_BODY = orjson.dumps(
+    {
+        "status": "healthy",
+        "version": settings.VERSION,
+        "environment": settings.ENVIRONMENT,
+    }
+)
+_ROOT_BODY = orjson.dumps(
+    {
+        "message": f"Welcome to {settings.APP_NAME}",
+        "version": settings.VERSION,
+        "docs": "/docs" if settings.DEBUG else "disabled",
+    }
 )
 
 
 @app.get("/health", tags=["Health"])
-async def health_check() -> JSONResponse:
+async def health_check() -> Response:
     """Health check endpoint.
 
     Used by:
@@ -79,25 +125,14 @@ async def health_check() -> JSONResponse:
     - Kubernetes probes
     - Monitoring systems
     """
-    return JSONResponse(
-        content={
-            "status": "healthy",
-            "version": settings.VERSION,
-            "environment": settings.ENVIRONMENT,
-        }
-    )
+    return Response(content=_HEALTH_BODY, media_type="application/json")
 
 
 @app.get("/", tags=["Root"])
-async def root() -> dict[str, str]:
+async def root() -> Response:
     """Root endpoint."""
-    return {
-        "message": f"Welcome to {settings.APP_NAME}",
-        "version": settings.VERSION,
-        "docs": "/docs" if settings.DEBUG else "disabled",
-    }
+    return Response(content=_ROOT_BODY, media_type="application/json")
 
 
 # Include API routers
-from app.api.v1.api import api_router
 app.include_router(api_router, prefix=settings.API_V1_PREFIX)
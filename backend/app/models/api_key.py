@@ -10,10 +10,11 @@ Security best practices:
 """
 
 from typing import Optional
-from uuid import UUID, uuid4
+from uuid import UUID
 
-from sqlalchemy import Boolean, String
+from sqlalchemy import Boolean, Index, LargeBinary, String, text
 from sqlalchemy.orm import Mapped, mapped_column
+from uuid6 import uuid7
 
 from app.db.base_class import Base, TimestampMixin
 
@@ -22,10 +23,11 @@ class APIKey(Base, TimestampMixin):
     """API Key for agent authentication.
 
     Security model:
-    1. Generate random key with secrets.token_urlsafe(32)
+    1. Generate key "gf_<id>.<secret>" with secrets.token_urlsafe(32)
     2. Show key to user ONCE (they must save it)
-    3. Store only SHA256 hash in database
-    4. On auth: hash incoming key, compare with stored hash
+    3. Store only SHA256 digest in database (32 bytes, BYTEA)
+    4. On auth: parse the ID from the key, load the row by primary key,
+       hash incoming key and compare with stored hash (constant time)
 
     This means:
     - If database is compromised, keys can't be recovered
@@ -33,53 +35,59 @@ class APIKey(Base, TimestampMixin):
     - Same security model as passwords
 
     Attributes:
-        id: Primary key
-        key_hash: SHA256 hash of the API key
+        id: Primary key (also embedded in the raw key)
+        key_hash: SHA256 digest of the API key
         name: Human-readable name (e.g., "code-review-agent")
         description: Optional description
         is_active: Soft delete / revocation flag
 
     Example:
-        # Generate new API key
-        import secrets
-        import hashlib
+        from uuid6 import uuid7
+        from app.core.security import generate_api_key, hash_api_key
 
-        # Generate random key (show this to user ONCE)
-        raw_key = secrets.token_urlsafe(32)  # ~43 chars
+        # Generate key (show this to user ONCE)
+        key_id = uuid7()
+        raw_key = generate_api_key(key_id)
         print(f"API Key (save this!): {raw_key}")
 
-        # Hash for storage
-        key_hash = hashlib.sha256(raw_key.encode()).hexdigest()
-
-        # Save to database
+        # Save to database (only the hash)
         api_key = APIKey(
-            key_hash=key_hash,
+            id=key_id,
+            key_hash=hash_api_key(raw_key),
             name="code-review-agent",
             description="Agent that reviews code changes"
         )
 
         # Later, to verify:
-        incoming_hash = hashlib.sha256(incoming_key.encode()).hexdigest()
-        db_key = db.query(APIKey).filter(
-            APIKey.key_hash == incoming_hash,
-            APIKey.is_active == True
-        ).first()
-
-        if db_key:
+        db_key = await db.get(APIKey, parse_api_key_id(incoming_key))
+        if db_key and db_key.is_active and hmac.compare_digest(
+            db_key.key_hash, hash_api_key(incoming_key)
+        ):
             # Valid key
             pass
     """
 
     __tablename__ = "api_keys"
+    __table_args__ = (
+        # Legacy keys are looked up by hash among active keys only
+        Index(
+            "ix_api_keys_key_hash_active",
+            "key_hash",
+            postgresql_where=text("is_active"),
+        ),
+    )
 
     # Primary Key
     id: Mapped[UUID] = mapped_column(
-        primary_key=True, default=uuid4, nullable=False
+        primary_key=True,
+        default=uuid7,  # Time-ordered: new rows append to the right of the PK index
+        server_default=text("gen_uuid_v7()"),
+        nullable=False,
     )
 
-    # Key (hashed with SHA256)
-    key_hash: Mapped[str] = mapped_column(
-        String(64), unique=True, index=True, nullable=False
+    # Key (SHA256 digest, raw 32 bytes - half the size of a hex string index)
+    key_hash: Mapped[bytes] = mapped_column(
+        LargeBinary(32), unique=True, index=True, nullable=False
     )
 
     # Identification
@@ -13,11 +13,13 @@ If request times out → state = "timeout"
 """
 
 from typing import Optional
-from uuid import UUID, uuid4
+from uuid import UUID
 from datetime import datetime
 
-from sqlalchemy import String, Text, ForeignKey, DateTime, JSON
+from sqlalchemy import String, Text, ForeignKey, DateTime, Index, text
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
+from uuid6 import uuid7
 
 from app.db.base_class import Base, TimestampMixin
 
@@ -49,7 +51,8 @@ class ConsultationRequest(Base, TimestampMixin):
         callback_sent_at: When webhook was successfully called
         timeout_at: When this request times out (if not responded)
 
-        metadata: Extra data from agent (workflow_id, checkpoint_id, etc.)
+        request_metadata: Extra data from agent (workflow_id, checkpoint_id, etc.)
+            - stored in the "metadata" column
 
     Relationships:
         responder: The User who responded to this request
@@ -67,7 +70,7 @@ class ConsultationRequest(Base, TimestampMixin):
             },
             callback_webhook="https://agent-system.com/resume",
             callback_secret="shared-secret",
-            metadata={
+            request_metadata={
                 "workflow_id": "wf-abc123",
                 "checkpoint_id": "cp-xyz789",
                 "agent_id": "code-review-agent"
@@ -76,19 +79,46 @@ class ConsultationRequest(Base, TimestampMixin):
     """
 
     __tablename__ = "consultation_requests"
+    __table_args__ = (
+        # Serves list_requests: filter by state, newest first
+        Index("ix_cr_state_created_at", "state", text("created_at DESC")),
+        # Serves containment filters like metadata @> '{"workflow_id": "..."}'
+        Index(
+            "ix_cr_metadata_gin",
+            "metadata",
+            postgresql_using="gin",
+            postgresql_ops={"metadata": "jsonb_path_ops"},
+        ),
+        # Serves agent filters like context @> '{"agent_id": "..."}'
+        Index(
+            "ix_cr_context_gin",
+            "context",
+            postgresql_using="gin",
+            postgresql_ops={"context": "jsonb_path_ops"},
+        ),
+        # Serves the timeout sweep: state = 'pending' AND timeout_at < now()
+        Index(
+            "ix_cr_timeout_pending",
+            "timeout_at",
+            postgresql_where=text("state = 'pending'"),
+        ),
+    )
 
     # Primary Key
     id: Mapped[UUID] = mapped_column(
-        primary_key=True, default=uuid4, nullable=False
+        primary_key=True,
+        default=uuid7,  # Time-ordered: new rows append to the right of the PK index
+        server_default=text("gen_uuid_v7()"),
+        nullable=False,
     )
 
     # Request Details
     title: Mapped[str] = mapped_column(String(255), nullable=False)
     description: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
 
-    # Context from agent (flexible JSON)
+    # Context from agent (flexible JSON, stored as binary JSONB, GIN-indexed)
     # Could contain: code_diff, risk_assessment, metrics, etc.
-    context: Mapped[dict] = mapped_column(JSON, nullable=False)
+    context: Mapped[dict] = mapped_column(JSONB, nullable=False)
 
     # Callback Configuration
     callback_webhook: Mapped[Optional[str]] = mapped_column(
@@ -100,12 +130,12 @@ class ConsultationRequest(Base, TimestampMixin):
 
     # State Machine
     state: Mapped[str] = mapped_column(
-        String(50), default="pending", index=True, nullable=False
+        String(50), default="pending", nullable=False
     )
     # States: pending, responded, callback_sent, completed, callback_failed, timeout
 
     # Response
-    response: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
+    response: Mapped[Optional[dict]] = mapped_column(JSONB, nullable=True)
 
     responded_by: Mapped[Optional[UUID]] = mapped_column(
         ForeignKey("users.id"), nullable=True
@@ -120,25 +150,31 @@ class ConsultationRequest(Base, TimestampMixin):
         DateTime(timezone=True), nullable=True
     )
 
-    # Timeout
+    # Timeout (indexed for pending rows only, see ix_cr_timeout_pending)
     timeout_at: Mapped[Optional[datetime]] = mapped_column(
-        DateTime(timezone=True), nullable=True, index=True
+        DateTime(timezone=True), nullable=True
     )
 
     # Metadata (workflow_id, checkpoint_id, agent_id, etc.)
-    metadata: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
+    # `metadata` is reserved on declarative classes, so only the attribute is
+    # renamed - the column and the API field are still called "metadata".
+    request_metadata: Mapped[Optional[dict]] = mapped_column("metadata", JSONB, nullable=True)
 
     # Timestamps from TimestampMixin:
-    # - created_at (indexed automatically for listing queries)
+    # - created_at (indexed with state via ix_cr_state_created_at for listing queries)
     # - updated_at
 
     # Relationships
+    # lazy="raise_on_sql": with AsyncSession an implicit lazy load can't run
+    # anyway, and per-row loads in list endpoints would be an N+1. Load these
+    # explicitly where needed, e.g.:
+    #     select(ConsultationRequest).options(selectinload(ConsultationRequest.responder))
     responder: Mapped[Optional["User"]] = relationship(
-        "User", foreign_keys=[responded_by]
+        "User", foreign_keys=[responded_by], lazy="raise_on_sql"
     )
 
     webhook_deliveries: Mapped[list["WebhookDelivery"]] = relationship(
-        "WebhookDelivery", back_populates="request"
+        "WebhookDelivery", back_populates="request", lazy="raise_on_sql"
     )
 
     def __repr__(self) -> str:
@@ -4,16 +4,17 @@ Represents people who log in to review and respond to consultation requests.
 
 Security best practices:
 - Never store plain text passwords (use hashed_password)
-- Use bcrypt for hashing (via passlib)
+- Use argon2id for hashing (via passlib)
 - Add is_active flag for soft deletes
 - Add role for future RBAC (Role-Based Access Control)
 """
 
 from typing import Optional
-from uuid import UUID, uuid4
+from uuid import UUID
 
-from sqlalchemy import Boolean, String
+from sqlalchemy import Boolean, String, text
 from sqlalchemy.orm import Mapped, mapped_column
+from uuid6 import uuid7
 
 from app.db.base_class import Base, TimestampMixin
 
@@ -25,7 +26,7 @@ class User(Base, TimestampMixin):
         id: Primary key (UUID for security - no enumeration attacks)
         email: Unique email address (used for login)
         name: Display name
-        hashed_password: Bcrypt hashed password (NEVER store plain text!)
+        hashed_password: Argon2id hashed password (NEVER store plain text!)
         is_active: Soft delete flag (instead of actually deleting users)
         role: User role (reviewer, admin, etc.) for future RBAC
 
@@ -48,7 +49,10 @@ class User(Base, TimestampMixin):
 
     # Primary Key
     id: Mapped[UUID] = mapped_column(
-        primary_key=True, default=uuid4, nullable=False
+        primary_key=True,
+        default=uuid7,  # Time-ordered: new rows append to the right of the PK index
+        server_default=text("gen_uuid_v7()"),
+        nullable=False,
     )
 
     # Authentication
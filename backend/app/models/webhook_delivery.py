@@ -10,10 +10,12 @@ Why track this?
 """
 
 from typing import Optional
-from uuid import UUID, uuid4
+from uuid import UUID
 
-from sqlalchemy import String, Text, Integer, ForeignKey, JSON
+from sqlalchemy import String, Text, Integer, ForeignKey, Index, text
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
+from uuid6 import uuid7
 
 from app.db.base_class import Base, TimestampMixin
 
@@ -65,21 +67,29 @@ class WebhookDelivery(Base, TimestampMixin):
     """
 
     __tablename__ = "webhook_deliveries"
+    __table_args__ = (
+        # Serves "attempts for a request, in order" (and plain request_id
+        # lookups, so request_id needs no index of its own)
+        Index("ix_wd_request_created", "request_id", "created_at"),
+    )
 
     # Primary Key
     id: Mapped[UUID] = mapped_column(
-        primary_key=True, default=uuid4, nullable=False
+        primary_key=True,
+        default=uuid7,  # Time-ordered: new rows append to the right of the PK index
+        server_default=text("gen_uuid_v7()"),
+        nullable=False,
     )
 
     # Foreign Key
     request_id: Mapped[UUID] = mapped_column(
-        ForeignKey("consultation_requests.id"), index=True, nullable=False
+        ForeignKey("consultation_requests.id"), nullable=False
     )
 
     # Delivery Details
     webhook_url: Mapped[str] = mapped_column(String(2048), nullable=False)
 
-    payload: Mapped[dict] = mapped_column(JSON, nullable=False)
+    payload: Mapped[dict] = mapped_column(JSONB, nullable=False)
 
     # Response
     status_code: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
@@ -92,12 +102,13 @@ class WebhookDelivery(Base, TimestampMixin):
     retry_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
 
     # Timestamps from TimestampMixin:
-    # - created_at (when this delivery was attempted)
+    # - created_at (when this delivery was attempted, indexed with request_id)
     # - updated_at
 
     # Relationships
+    # Load explicitly (selectinload/joinedload) - see ConsultationRequest.responder
     request: Mapped["ConsultationRequest"] = relationship(
-        "ConsultationRequest", back_populates="webhook_deliveries"
+        "ConsultationRequest", back_populates="webhook_deliveries", lazy="raise_on_sql"
     )
 
     def __repr__(self) -> str:
@@ -3,6 +3,7 @@
 All API request/response schemas are defined here.
 """
 
+from app.schemas.base import ORMResponse
 from app.schemas.user import (
     UserBase,
     UserCreate,
@@ -32,6 +33,8 @@ from app.schemas.api_key import (
 )
 
 __all__ = [
+    # Base classes
+    "ORMResponse",
     # User schemas
     "UserBase",
     "UserCreate",
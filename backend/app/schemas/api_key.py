@@ -8,7 +8,9 @@ from uuid import UUID
 from datetime import datetime
 from typing import Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+from app.schemas.base import ORMResponse
 
 
 # Base schema
@@ -44,7 +46,7 @@ class APIKeyCreated(APIKeyBase):
             "id": "...",
             "name": "code-review-agent",
             "description": "...",
-            "key": "hKj8sH3nX92lP4mN6vB1qW0zR...",  # RAW KEY (shown once!)
+            "key": "gf_01932c4e-....hKj8sH3nX92lP4mN6vB1qW0zR...",  # RAW KEY (shown once!)
             "created_at": "2024-01-15T10:30:00Z"
         }
     """
@@ -53,14 +55,11 @@ class APIKeyCreated(APIKeyBase):
     key: str = Field(..., description="RAW API KEY - SAVE THIS! It won't be shown again")
     created_at: datetime
 
-    class Config:
-        """Pydantic configuration."""
-
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # Schema for returning existing API keys (GET /api/v1/api-keys, GET /api/v1/api-keys/{id})
-class APIKeyResponse(APIKeyBase):
+class APIKeyResponse(APIKeyBase, ORMResponse):
     """Schema for API key in responses (no raw key!).
 
     Example:
@@ -80,10 +79,7 @@ class APIKeyResponse(APIKeyBase):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        """Pydantic configuration."""
-
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # Schema for updating an API key (PATCH /api/v1/api-keys/{id})
@@ -0,0 +1,56 @@
+"""Shared base for response schemas built from ORM objects.
+
+`Response.model_validate(row)` runs every field validator (UUID, datetime,
+EmailStr, length checks...) on values that came straight out of the
+database and are already the right types. For list endpoints that's
+repeated for every row.
+
+`from_orm_fast` copies the attributes with plain getattr and builds the
+model with `model_construct`, which skips validation. FastAPI then accepts
+the instance as-is (instances of the response model are not revalidated)
+and only serializes it.
+
+`dump_orm` goes one step further and returns the plain dict, for routes
+that encode the response themselves (app.api.responses.FastJSONResponse).
+
+Only use it for trusted ORM rows - request bodies (*Create/*Update) must
+still go through normal validation.
+"""
+
+from typing import Any, ClassVar, Self
+
+from pydantic import BaseModel
+
+
+class ORMResponse(BaseModel):
+    """Base class for response schemas that are built from ORM rows."""
+
+    # Schema field -> ORM attribute, for fields whose names differ
+    orm_attribute_names: ClassVar[dict[str, str]] = {}
+
+    # (field name, ORM attribute) pairs, computed once per subclass
+    orm_fields: ClassVar[tuple[tuple[str, str], ...]] = ()
+
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: Any) -> None:
+        super().__pydantic_init_subclass__(**kwargs)
+        cls.orm_fields = tuple(
+            (name, cls.orm_attribute_names.get(name, name)) for name in cls.model_fields
+        )
+
+    @classmethod
+    def dump_orm(cls, obj: Any) -> dict[str, Any]:
+        """Read this schema's fields from a trusted ORM object into a dict."""
+        # Loaded column values live in the instance __dict__; reading them
+        # from there skips SQLAlchemy's attribute descriptor. Anything not
+        # loaded (expired, deferred) still goes through getattr.
+        loaded = obj.__dict__
+        return {
+            name: loaded[attribute] if attribute in loaded else getattr(obj, attribute)
+            for name, attribute in cls.orm_fields
+        }
+
+    @classmethod
+    def from_orm_fast(cls, obj: Any) -> Self:
+        """Build the schema from a trusted ORM object without validation."""
+        return cls.model_construct(**cls.dump_orm(obj))
@@ -5,9 +5,35 @@ These schemas define the API contract between agents and the HITL service.
 
 from uuid import UUID
 from datetime import datetime
-from typing import Optional, Any
+from functools import lru_cache
+from typing import Any, ClassVar, Literal, Optional
 
-from pydantic import BaseModel, Field, HttpUrl
+from pydantic import (
+    AliasChoices,
+    BaseModel,
+    ConfigDict,
+    Field,
+    HttpUrl,
+    TypeAdapter,
+    ValidationError,
+    field_validator,
+)
+
+from app.schemas.base import ORMResponse
+
+# Closed value sets, checked as literals (a set lookup, not a regex match)
+RequestState = Literal[
+    "pending", "responded", "callback_sent", "completed", "callback_failed", "timeout"
+]
+Decision = Literal["approve", "reject", "request_changes"]
+
+_http_url = TypeAdapter(HttpUrl)
+
+
+@lru_cache(maxsize=1024)
+def _parse_webhook_url(url: str) -> HttpUrl:
+    """Parse a callback URL (agents reuse a handful, so results are cached)."""
+    return _http_url.validate_python(url)
 
 
 # Base schema
@@ -63,6 +89,18 @@ class ConsultationRequestCreate(ConsultationRequestBase):
         description="How long to wait for response (minutes)",
     )
 
+    @field_validator("callback_webhook", mode="before")
+    @classmethod
+    def parse_callback_webhook(cls, v: Any) -> Any:
+        """Reuse the parsed URL when an agent sends the same webhook again."""
+        if isinstance(v, str):
+            try:
+                return _parse_webhook_url(v)
+            except ValidationError:
+                # Let the field validator report it with the usual error
+                return v
+        return v
+
 
 # Schema for updating a request (PATCH /api/v1/requests/{id})
 class ConsultationRequestUpdate(BaseModel):
@@ -70,9 +108,7 @@ class ConsultationRequestUpdate(BaseModel):
 
     title: Optional[str] = Field(None, max_length=255)
     description: Optional[str] = None
-    state: Optional[str] = Field(
-        None, pattern="^(pending|responded|callback_sent|completed|callback_failed|timeout)$"
-    )
+    state: Optional[RequestState] = None
 
 
 # Schema for human response (POST /api/v1/requests/{id}/respond)
@@ -86,16 +122,12 @@ class HumanResponse(BaseModel):
         }
     """
 
-    decision: str = Field(
-        ...,
-        pattern="^(approve|reject|request_changes)$",
-        description="Human's decision",
-    )
+    decision: Decision = Field(..., description="Human's decision")
     comment: Optional[str] = Field(None, description="Optional comment/feedback")
 
 
 # Schema for returning request data (GET /api/v1/requests, GET /api/v1/requests/{id})
-class ConsultationRequestResponse(ConsultationRequestBase):
+class ConsultationRequestResponse(ConsultationRequestBase, ORMResponse):
     """Schema for consultation request in API responses.
 
     Example:
@@ -114,6 +146,14 @@ class ConsultationRequestResponse(ConsultationRequestBase):
         }
     """
 
+    orm_attribute_names: ClassVar[dict[str, str]] = {"metadata": "request_metadata"}
+
+    # Read from the ORM attribute (request_metadata) under from_attributes
+    metadata: Optional[dict[str, Any]] = Field(
+        None,
+        description="Additional metadata (workflow_id, etc.)",
+        validation_alias=AliasChoices("request_metadata", "metadata"),
+    )
     id: UUID
     state: str
     response: Optional[dict[str, Any]] = None
@@ -124,10 +164,7 @@ class ConsultationRequestResponse(ConsultationRequestBase):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        """Pydantic configuration."""
-
-        from_attributes = True  # Allow creating from ORM models
+    model_config = ConfigDict(from_attributes=True)  # Allow creating from ORM models
 
 
 # Schema for list responses (GET /api/v1/requests)
@@ -139,11 +176,16 @@ class ConsultationRequestList(BaseModel):
             "items": [...],
             "total": 42,
             "limit": 20,
-            "offset": 0
+            "offset": 0,
+            "next_cursor": "MjAyNC0wMS0xNVQxMDozMDowMCswMDowMHw1NTBl..."
         }
+
+    `total` is null for cursor (`after=...`) pages.
+    `next_cursor` is null on the last page.
     """
 
     items: list[ConsultationRequestResponse]
-    total: int
+    total: Optional[int] = None
     limit: int
     offset: int
+    next_cursor: Optional[str] = None
@@ -15,7 +15,9 @@ from uuid import UUID
 from datetime import datetime
 from typing import Optional
 
-from pydantic import BaseModel, EmailStr, Field
+from pydantic import BaseModel, ConfigDict, EmailStr, Field
+
+from app.schemas.base import ORMResponse
 
 
 # Base schema (common fields)
@@ -69,7 +71,7 @@ class UserUpdate(BaseModel):
 
 
 # Schema for returning user data (GET /users, GET /users/{id})
-class UserResponse(UserBase):
+class UserResponse(UserBase, ORMResponse):
     """Schema for user in API responses.
 
     Note: We don't include hashed_password!
@@ -86,16 +88,15 @@ class UserResponse(UserBase):
         }
     """
 
+    # Already validated when the user was created; EmailStr would run
+    # email-validator again on every response
+    email: str
     id: UUID
     is_active: bool
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        """Pydantic configuration."""
-
-        from_attributes = True  # Allow creating from ORM models
-        # Before Pydantic v2 this was: orm_mode = True
+    model_config = ConfigDict(from_attributes=True)  # Allow creating from ORM models
 
 
 # Schema for user in JWT token payload
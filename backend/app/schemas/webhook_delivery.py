@@ -7,7 +7,9 @@ from uuid import UUID
 from datetime import datetime
 from typing import Optional, Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+from app.schemas.base import ORMResponse
 
 
 # Base schema
@@ -30,7 +32,7 @@ class WebhookDeliveryCreate(WebhookDeliveryBase):
 
 
 # Schema for returning delivery data (GET /api/v1/webhook-deliveries/{id})
-class WebhookDeliveryResponse(WebhookDeliveryBase):
+class WebhookDeliveryResponse(WebhookDeliveryBase, ORMResponse):
     """Schema for webhook delivery in API responses.
 
     Example:
@@ -55,7 +57,4 @@ class WebhookDeliveryResponse(WebhookDeliveryBase):
     retry_count: int
     created_at: datetime
 
-    class Config:
-        """Pydantic configuration."""
-
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
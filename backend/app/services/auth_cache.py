@@ -0,0 +1,117 @@
+"""
+Authentication caches, invalidated across worker processes.
+
+Authenticated principals are cached per process for a short TTL so repeated
+requests with the same token/key don't hit Postgres every time:
+
+- user_cache: JWT jti -> User
+- api_key_cache: key hash -> APIKey
+
+Each uvicorn worker has its own copy, so API key changes are broadcast over
+Redis pub/sub: `invalidate_api_key` drops the entry locally and publishes it
+on INVALIDATION_CHANNEL, and a listener task in every process (started from
+the app lifespan) drops it there too.
+
+The API has no endpoint that deactivates users or changes their role (that
+is done directly in the database), so user entries are only refreshed when
+their TTL expires. Pub/sub doesn't buffer messages for disconnected
+subscribers, so the listener also clears both caches whenever it
+(re)subscribes.
+
+Cached objects are expunged from their session, so they are plain detached
+instances - read attributes only, never lazy-load relationships from them.
+"""
+
+import asyncio
+import logging
+from typing import Optional
+
+from cachetools import TTLCache
+
+from app.db.redis import get_redis
+
+logger = logging.getLogger(__name__)
+
+# Redis pub/sub channel for cache invalidations ("apikey:<hash hex>")
+INVALIDATION_CHANNEL = "auth:invalidate"
+
+# Seconds to wait before resubscribing after the Redis connection is lost
+RECONNECT_DELAY = 5.0
+
+# Short TTLs: they bound staleness for users, and for API keys when an
+# invalidation can't be delivered
+user_cache: TTLCache = TTLCache(maxsize=10_000, ttl=60)
+api_key_cache: TTLCache = TTLCache(maxsize=10_000, ttl=60)
+
+_listener: Optional["asyncio.Task[None]"] = None
+
+
+async def invalidate_api_key(key_hash: bytes) -> None:
+    """Drop a cached API key in every worker (call after revoking or editing it)."""
+    _apply(f"apikey:{key_hash.hex()}")
+    await _publish(f"apikey:{key_hash.hex()}")
+
+
+async def start() -> None:
+    """Start listening for invalidations (called from the app lifespan)."""
+    global _listener
+
+    if _listener is None:
+        _listener = asyncio.create_task(_listen(), name="auth-cache-invalidation")
+
+
+async def stop() -> None:
+    """Stop the invalidation listener."""
+    global _listener
+
+    if _listener is None:
+        return
+
+    _listener.cancel()
+    try:
+        await _listener
+    except asyncio.CancelledError:
+        pass
+    _listener = None
+
+
+async def _publish(message: str) -> None:
+    """Broadcast an invalidation; local state is already updated if this fails."""
+    try:
+        await get_redis().publish(INVALIDATION_CHANNEL, message)
+    except Exception as e:
+        logger.warning(
+            f"Could not broadcast auth cache invalidation {message!r} "
+            f"(other workers drop it after the cache TTL): {e}"
+        )
+
+
+def _apply(message: str) -> None:
+    """Drop the cache entries an invalidation message refers to."""
+    kind, _, value = message.partition(":")
+    if kind == "apikey":
+        api_key_cache.pop(bytes.fromhex(value), None)
+    else:
+        logger.warning(f"Ignoring unknown auth cache invalidation {message!r}")
+
+
+async def _listen() -> None:
+    """Apply invalidations published by any worker, resubscribing on errors."""
+    while True:
+        try:
+            async with get_redis().pubsub() as pubsub:
+                await pubsub.subscribe(INVALIDATION_CHANNEL)
+
+                # Anything published while we weren't subscribed was missed
+                user_cache.clear()
+                api_key_cache.clear()
+
+                async for message in pubsub.listen():
+                    if message["type"] == "message":
+                        _apply(message["data"])
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning(f"Auth cache invalidation listener disconnected: {e}")
+
+        await asyncio.sleep(RECONNECT_DELAY)
@@ -5,7 +5,8 @@ Provides pluggable email providers (Resend, SendGrid) with a simple interface.
 """
 
 from .base import EmailProvider, EmailMessage
-from .factory import get_email_provider, send_notification_email
+from .dispatcher import send_notification_email
+from .factory import close_email_provider, get_email_provider
 from .templates import (
     new_request_email,
     request_responded_email,
@@ -15,6 +16,7 @@ from .templates import (
 __all__ = [
     "EmailProvider",
     "EmailMessage",
+    "close_email_provider",
     "get_email_provider",
     "send_notification_email",
     "new_request_email",
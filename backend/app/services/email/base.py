@@ -4,20 +4,41 @@ Abstract base class for email providers.
 This allows swapping email providers (Resend, SendGrid, etc.) without changing application code.
 """
 
+import asyncio
 from abc import ABC, abstractmethod
-from typing import Optional, List
+from typing import Iterable, List
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class EmailMessage:
-    """Email message data structure."""
+    """Email message data structure.
 
-    to: str | List[str]
+    Immutable (and slotted, so no per-instance __dict__): messages are
+    created per notification and handed to the dispatcher workers as-is.
+
+    `to` is always a tuple of addresses; build messages with `of()` to
+    accept a single address as well.
+    """
+
+    to: tuple[str, ...]
     subject: str
     html: str
-    from_email: Optional[str] = None
-    reply_to: Optional[str] = None
+    from_email: str | None = None
+    reply_to: str | None = None
+
+    @classmethod
+    def of(
+        cls,
+        to: str | Iterable[str],
+        subject: str,
+        html: str,
+        from_email: str | None = None,
+        reply_to: str | None = None,
+    ) -> "EmailMessage":
+        """Create a message, normalizing the recipient(s) to a tuple once."""
+        recipients = (to,) if isinstance(to, str) else tuple(to)
+        return cls(recipients, subject, html, from_email, reply_to)
 
 
 class EmailProvider(ABC):
@@ -43,3 +64,15 @@ class EmailProvider(ABC):
     def get_provider_name(self) -> str:
         """Return the provider name (e.g., 'resend', 'sendgrid')."""
         pass
+
+    async def send_batch(self, messages: List[EmailMessage]) -> List[bool]:
+        """
+        Send several emails, returning one success flag per message.
+
+        By default the messages are sent concurrently with send_email();
+        providers with a batch API override this to use one request.
+        """
+        return list(await asyncio.gather(*(self.send_email(m) for m in messages)))
+
+    async def aclose(self) -> None:  # noqa: B027 - optional hook, no-op by default
+        """Release held resources such as HTTP connections (called on shutdown)."""
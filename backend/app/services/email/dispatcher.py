@@ -0,0 +1,128 @@
+"""
+Background email dispatcher.
+
+Notification emails are sent by background workers instead of inline by the
+caller. `send_notification_email` only puts the message on a bounded queue;
+WORKERS tasks drain it in batches of up to BATCH_SIZE messages and hand each
+batch to the provider's `send_batch` (one request for Resend's batch API,
+concurrent sends otherwise).
+
+A burst of new requests then costs the API one queue put per email rather
+than one provider round-trip each, and the sends themselves overlap.
+
+If the dispatcher isn't running (scripts, tests), emails are sent inline.
+"""
+
+import asyncio
+import logging
+from typing import Optional
+
+from .base import EmailMessage, EmailProvider
+from .factory import get_email_provider
+
+logger = logging.getLogger(__name__)
+
+# Concurrent worker tasks
+WORKERS = 4
+
+# Most messages a worker takes off the queue for one send_batch call
+BATCH_SIZE = 16
+
+# Upper bound on queued emails; callers wait when the queue is full
+MAX_PENDING = 10_000
+
+_queue: Optional["asyncio.Queue[EmailMessage]"] = None
+_workers: list["asyncio.Task[None]"] = []
+
+
+async def send_notification_email(to: str | list[str], subject: str, html: str) -> bool:
+    """
+    Send an email using the configured provider.
+
+    Args:
+        to: Recipient email address(es)
+        subject: Email subject
+        html: HTML email content
+
+    Returns:
+        True if queued (dispatcher running) or sent successfully, False otherwise
+    """
+    provider = get_email_provider()
+
+    if provider is None:
+        logger.warning(f"Email notifications disabled, skipping email to {to}")
+        return False
+
+    message = EmailMessage.of(to, subject, html)
+
+    if _queue is not None:
+        await _queue.put(message)
+        return True
+
+    try:
+        return await provider.send_email(message)
+    except Exception as e:
+        logger.exception(f"Failed to send email: {str(e)}")
+        return False
+
+
+async def start() -> None:
+    """Start the dispatcher workers (called from the app lifespan).
+
+    Does nothing when email notifications are disabled.
+    """
+    global _queue, _workers
+
+    if _queue is not None:
+        return
+
+    provider = get_email_provider()
+    if provider is None:
+        return
+
+    _queue = asyncio.Queue(maxsize=MAX_PENDING)
+    _workers = [
+        asyncio.create_task(_work(_queue, provider), name=f"email-dispatcher-{i}")
+        for i in range(WORKERS)
+    ]
+    logger.info(f"Email dispatcher started ({WORKERS} workers)")
+
+
+async def stop() -> None:
+    """Send everything that's queued, then stop the workers."""
+    global _queue, _workers
+
+    if _queue is None:
+        return
+
+    # Let the workers drain everything that's already queued
+    await _queue.join()
+    for worker in _workers:
+        worker.cancel()
+    await asyncio.gather(*_workers, return_exceptions=True)
+
+    _queue = None
+    _workers = []
+    logger.info("Email dispatcher stopped")
+
+
+async def _work(queue: "asyncio.Queue[EmailMessage]", provider: EmailProvider) -> None:
+    """Send queued emails in batches of whatever is waiting (up to BATCH_SIZE)."""
+    while True:
+        batch = [await queue.get()]
+        while len(batch) < BATCH_SIZE:
+            try:
+                batch.append(queue.get_nowait())
+            except asyncio.QueueEmpty:
+                break
+
+        try:
+            results = await provider.send_batch(batch)
+            failed = results.count(False)
+            if failed:
+                logger.warning(f"{failed} of {len(batch)} queued email(s) failed to send")
+        except Exception:
+            logger.exception(f"Failed to send {len(batch)} queued email(s)")
+        finally:
+            for _ in batch:
+                queue.task_done()
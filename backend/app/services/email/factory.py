@@ -5,7 +5,8 @@ Provides a centralized way to get the configured email provider.
 """
 
 import logging
-from typing import Optional
+from functools import lru_cache
+from typing import Callable, Optional
 
 from app.core.config import settings
 from .base import EmailProvider
@@ -14,88 +15,72 @@ from .sendgrid import SendGridEmailProvider
 
 logger = logging.getLogger(__name__)
 
-_provider_instance: Optional[EmailProvider] = None
 
+def _build_resend() -> EmailProvider:
+    """Create the Resend provider from settings."""
+    if not settings.RESEND_API_KEY:
+        raise ValueError("RESEND_API_KEY is required when EMAIL_PROVIDER='resend'")
+    if not settings.RESEND_FROM_EMAIL:
+        raise ValueError("RESEND_FROM_EMAIL is required when EMAIL_PROVIDER='resend'")
 
+    logger.info("Initializing Resend email provider")
+    return ResendEmailProvider(
+        api_key=settings.RESEND_API_KEY, from_email=settings.RESEND_FROM_EMAIL
+    )
+
+
+def _build_sendgrid() -> EmailProvider:
+    """Create the SendGrid provider from settings."""
+    if not settings.SENDGRID_API_KEY:
+        raise ValueError("SENDGRID_API_KEY is required when EMAIL_PROVIDER='sendgrid'")
+    if not settings.SENDGRID_FROM_EMAIL:
+        raise ValueError("SENDGRID_FROM_EMAIL is required when EMAIL_PROVIDER='sendgrid'")
+
+    logger.info("Initializing SendGrid email provider")
+    return SendGridEmailProvider(
+        api_key=settings.SENDGRID_API_KEY, from_email=settings.SENDGRID_FROM_EMAIL
+    )
+
+
+# EMAIL_PROVIDER value -> provider builder
+_BUILDERS: dict[str, Callable[[], EmailProvider]] = {
+    "resend": _build_resend,
+    "sendgrid": _build_sendgrid,
+}
+
+
+@lru_cache(maxsize=1)
 def get_email_provider() -> Optional[EmailProvider]:
     """
     Get the configured email provider instance.
 
+    The provider is created on the first call and reused afterwards
+    (settings don't change while the process runs).
+
     Returns:
         EmailProvider instance or None if email is not configured
 
     Raises:
-        ValueError: If provider type is unknown or configuration is invalid
+        ValueError: If the provider's configuration is invalid
     """
-    global _provider_instance
-
-    # Return cached instance if available
-    if _provider_instance is not None:
-        return _provider_instance
-
     # Check if email is enabled
     if not settings.EMAIL_ENABLED:
         logger.info("Email notifications are disabled in configuration")
         return None
 
-    provider_type = settings.EMAIL_PROVIDER.lower()
-
-    # Create provider based on configuration
-    if provider_type == "resend":
-        if not settings.RESEND_API_KEY:
-            raise ValueError("RESEND_API_KEY is required when EMAIL_PROVIDER='resend'")
-        if not settings.RESEND_FROM_EMAIL:
-            raise ValueError("RESEND_FROM_EMAIL is required when EMAIL_PROVIDER='resend'")
-
-        logger.info("Initializing Resend email provider")
-        _provider_instance = ResendEmailProvider(
-            api_key=settings.RESEND_API_KEY, from_email=settings.RESEND_FROM_EMAIL
-        )
+    # EMAIL_PROVIDER is normalized and checked against the supported
+    # providers when settings load
+    provider = _BUILDERS[settings.EMAIL_PROVIDER]()
+    logger.info(f"Email provider initialized: {provider.get_provider_name()}")
+    return provider
 
-    elif provider_type == "sendgrid":
-        if not settings.SENDGRID_API_KEY:
-            raise ValueError("SENDGRID_API_KEY is required when EMAIL_PROVIDER='sendgrid'")
-        if not settings.SENDGRID_FROM_EMAIL:
-            raise ValueError("SENDGRID_FROM_EMAIL is required when EMAIL_PROVIDER='sendgrid'")
 
-        logger.info("Initializing SendGrid email provider")
-        _provider_instance = SendGridEmailProvider(
-            api_key=settings.SENDGRID_API_KEY, from_email=settings.SENDGRID_FROM_EMAIL
-        )
-
-    else:
-        raise ValueError(
-            f"Unknown email provider: {provider_type}. Supported: 'resend', 'sendgrid'"
-        )
-
-    logger.info(f"Email provider initialized: {_provider_instance.get_provider_name()}")
-    return _provider_instance
-
-
-async def send_notification_email(to: str | list[str], subject: str, html: str) -> bool:
-    """
-    Convenience function to send an email using the configured provider.
-
-    Args:
-        to: Recipient email address(es)
-        subject: Email subject
-        html: HTML email content
-
-    Returns:
-        True if sent successfully, False otherwise
-    """
-    from .base import EmailMessage
+async def close_email_provider() -> None:
+    """Close the cached email provider's connections (called on shutdown)."""
+    if get_email_provider.cache_info().currsize == 0:
+        return  # Never created, nothing to close
 
     provider = get_email_provider()
-
-    if provider is None:
-        logger.warning(f"Email notifications disabled, skipping email to {to}")
-        return False
-
-    message = EmailMessage(to=to, subject=subject, html=html)
-
-    try:
-        return await provider.send_email(message)
-    except Exception as e:
-        logger.exception(f"Failed to send email: {str(e)}")
-        return False
+    if provider is not None:
+        await provider.aclose()
+    get_email_provider.cache_clear()
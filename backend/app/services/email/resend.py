@@ -6,13 +6,17 @@ API Docs: https://resend.com/docs/send-with-python
 """
 
 import httpx
-from typing import Optional
+import orjson
+from typing import Any, List, Optional
 import logging
 
 from .base import EmailProvider, EmailMessage
 
 logger = logging.getLogger(__name__)
 
+# Most emails Resend accepts in one batch request
+BATCH_LIMIT = 100
+
 
 class ResendEmailProvider(EmailProvider):
     """Email provider using Resend API."""
@@ -28,6 +32,8 @@ class ResendEmailProvider(EmailProvider):
         self.api_key = api_key
         self.from_email = from_email
         self.api_url = "https://api.resend.com/emails"
+        self.batch_url = "https://api.resend.com/emails/batch"
+        self._client: Optional[httpx.AsyncClient] = None  # Created on first send
 
     async def send_email(self, message: EmailMessage) -> bool:
         """
@@ -42,44 +48,27 @@ class ResendEmailProvider(EmailProvider):
         }
         """
         try:
-            # Prepare recipients list
-            recipients = message.to if isinstance(message.to, list) else [message.to]
-
-            # Build payload
-            payload = {
-                "from": message.from_email or self.from_email,
-                "to": recipients,
-                "subject": message.subject,
-                "html": message.html,
-            }
-
-            if message.reply_to:
-                payload["reply_to"] = message.reply_to
-
-            # Send request to Resend API
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    self.api_url,
-                    json=payload,
-                    headers={
-                        "Authorization": f"Bearer {self.api_key}",
-                        "Content-Type": "application/json",
-                    },
-                    timeout=10.0,
-                )
+            payload = self._build_payload(message)
 
-                if response.status_code == 200:
-                    logger.info(
-                        f"Email sent successfully via Resend to {recipients}",
-                        extra={"email_id": response.json().get("id")},
-                    )
-                    return True
-                else:
-                    logger.error(
-                        f"Resend API error: {response.status_code} - {response.text}",
-                        extra={"to": recipients, "subject": message.subject},
-                    )
-                    return False
+            # Send request to Resend API (pooled connection, reused across emails).
+            # Bodies are encoded/decoded with orjson; the client already sets
+            # Content-Type: application/json.
+            response = await self._get_client().post(
+                self.api_url, content=orjson.dumps(payload)
+            )
+
+            if response.status_code == 200:
+                logger.info(
+                    f"Email sent successfully via Resend to {message.to}",
+                    extra={"email_id": orjson.loads(response.content).get("id")},
+                )
+                return True
+            else:
+                logger.error(
+                    f"Resend API error: {response.status_code} - {response.text}",
+                    extra={"to": message.to, "subject": message.subject},
+                )
+                return False
 
         except Exception as e:
             logger.exception(
@@ -88,5 +77,78 @@ class ResendEmailProvider(EmailProvider):
             )
             return False
 
+    async def send_batch(self, messages: List[EmailMessage]) -> List[bool]:
+        """
+        Send emails via Resend's batch endpoint (one request per 100 emails).
+
+        The batch endpoint accepts or rejects a request as a whole, so every
+        message in a chunk gets the same result.
+        """
+        results: List[bool] = []
+
+        for start in range(0, len(messages), BATCH_LIMIT):
+            chunk = messages[start : start + BATCH_LIMIT]
+            try:
+                response = await self._get_client().post(
+                    self.batch_url,
+                    content=orjson.dumps([self._build_payload(m) for m in chunk]),
+                )
+                sent = response.status_code == 200
+                if sent:
+                    logger.info(f"Sent {len(chunk)} email(s) via Resend batch")
+                else:
+                    logger.error(
+                        f"Resend batch API error: {response.status_code} - {response.text}",
+                        extra={"count": len(chunk)},
+                    )
+            except Exception as e:
+                logger.exception(
+                    f"Failed to send email batch via Resend: {str(e)}",
+                    extra={"count": len(chunk)},
+                )
+                sent = False
+
+            results.extend([sent] * len(chunk))
+
+        return results
+
+    def _build_payload(self, message: EmailMessage) -> dict[str, Any]:
+        """Build the Resend API payload for one message."""
+        payload: dict[str, Any] = {
+            "from": message.from_email or self.from_email,
+            "to": message.to,  # orjson encodes the tuple as a JSON array
+            "subject": message.subject,
+            "html": message.html,
+        }
+
+        if message.reply_to:
+            payload["reply_to"] = message.reply_to
+
+        return payload
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Return the provider's HTTP client, creating it on first use.
+
+        One pooled client keeps the connection (and TLS session) to the API
+        alive across emails instead of handshaking for every message.
+        """
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                http2=True,
+                timeout=10.0,
+                limits=httpx.Limits(max_connections=50, max_keepalive_connections=20),
+                headers={
+                    "Authorization": f"Bearer {self.api_key}",
+                    "Content-Type": "application/json",
+                },
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the HTTP client."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
     def get_provider_name(self) -> str:
         return "resend"
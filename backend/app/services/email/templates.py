@@ -2,58 +2,122 @@
 Email templates for HITL service notifications.
 
 All templates are HTML-formatted and mobile-responsive.
+
+Values that come from requests and responses (titles, descriptions, comments,
+IDs) are agent- or user-supplied, so they are HTML-escaped once when the
+template reads them.
 """
 
-from datetime import datetime
+import time
+from functools import lru_cache
+from html import escape
 from typing import Dict, Any
 
+# (accent color, label) per decision
+_DECISIONS = {
+    "approve": ("#10B981", "Approve"),
+    "reject": ("#EF4444", "Reject"),
+    "request_changes": ("#F59E0B", "Request Changes"),
+}
 
-def new_request_email(request_data: Dict[str, Any], dashboard_url: str) -> str:
-    """
-    Email template for notifying reviewers of a new consultation request.
+# Color for decisions not in _DECISIONS (their label is derived from the value)
+_UNKNOWN_DECISION_COLOR = "#6B7280"
 
-    Args:
-        request_data: Dictionary with request details (title, description, context, id)
-        dashboard_url: URL to the dashboard
+# (minute since the epoch, formatted timestamp) of the last _utc_minute() call
+_minute_cache: tuple[int, str] = (-1, "")
 
-    Returns:
-        HTML email content
-    """
+
+def _utc_minute() -> str:
+    """Current UTC time as "YYYY-MM-DD HH:MM UTC", formatted once per minute."""
+    global _minute_cache
+
+    minute = int(time.time()) // 60
+    if _minute_cache[0] != minute:
+        formatted = time.strftime("%Y-%m-%d %H:%M UTC", time.gmtime(minute * 60))
+        _minute_cache = (minute, formatted)
+    return _minute_cache[1]
+
+
+def _text(value: Any) -> str:
+    """HTML-escape a value for use in template markup (text or attribute)."""
+    return escape(str(value))
+
+
+def _page(title: str, accent: str, heading: str, content: str, footer_note: str) -> str:
+    """Wrap a message body in the document, header and footer all emails share."""
     return f"""
     <!DOCTYPE html>
     <html>
     <head>
         <meta charset="utf-8">
         <meta name="viewport" content="width=device-width, initial-scale=1.0">
-        <title>New Consultation Request</title>
+        <title>{title}</title>
     </head>
     <body style="font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, 'Helvetica Neue', Arial, sans-serif; line-height: 1.6; color: #333; max-width: 600px; margin: 0 auto; padding: 20px;">
-        <div style="background-color: #3B82F6; color: white; padding: 20px; border-radius: 8px 8px 0 0;">
-            <h1 style="margin: 0; font-size: 24px;">New Consultation Request</h1>
+        <div style="background-color: {accent}; color: white; padding: 20px; border-radius: 8px 8px 0 0;">
+            <h1 style="margin: 0; font-size: 24px;">{heading}</h1>
+        </div>
+
+        <div style="background-color: #f8f9fa; padding: 20px; border: 1px solid #e9ecef; border-top: none; border-radius: 0 0 8px 8px;">{content}</div>
+
+        <div style="margin-top: 20px; padding: 15px; background-color: #f8f9fa; border-radius: 4px; text-align: center; color: #6c757d; font-size: 12px;">
+            <p style="margin: 0;">This is an automated {footer_note} from the HITL Service.</p>
         </div>
+    </body>
+    </html>
+    """
 
-        <div style="background-color: #f8f9fa; padding: 20px; border: 1px solid #e9ecef; border-top: none; border-radius: 0 0 8px 8px;">
-            <h2 style="color: #3B82F6; margin-top: 0;">{request_data.get('title', 'Untitled Request')}</h2>
 
-            {f"<p style='color: #6c757d;'>{request_data.get('description', '')}</p>" if request_data.get('description') else ''}
+def new_request_email(request_data: Dict[str, Any], dashboard_url: str) -> str:
+    """
+    Email template for notifying reviewers of a new consultation request.
+
+    Args:
+        request_data: Dictionary with request details (title, description, context, id)
+        dashboard_url: URL to the dashboard
+
+    Returns:
+        HTML email content
+    """
+    # Read each field (and build the optional rows) once; the markup below
+    # only formats them
+    title = _text(request_data.get("title", "Untitled Request"))
+    description = request_data.get("description")
+    request_id = request_data.get("id")
+    display_id = _text(request_id or "N/A")
+    view_url = f"{dashboard_url}/requests/{_text(request_id)}"
+    workflow_id = (request_data.get("metadata") or {}).get("workflow_id")
+
+    description_html = f"<p style='color: #6c757d;'>{_text(description)}</p>" if description else ""
+    workflow_row = (
+        f"<tr><td style='padding: 8px 0; color: #6c757d; font-weight: 600;'>Workflow ID:</td>"
+        f"<td style='padding: 8px 0; font-family: monospace;'>{_text(workflow_id)}</td></tr>"
+        if workflow_id
+        else ""
+    )
+
+    content = f"""
+            <h2 style="color: #3B82F6; margin-top: 0;">{title}</h2>
+
+            {description_html}
 
             <div style="background-color: white; padding: 15px; border-radius: 4px; margin: 20px 0;">
                 <h3 style="margin-top: 0; color: #495057; font-size: 16px;">Request Details</h3>
                 <table style="width: 100%; border-collapse: collapse;">
                     <tr>
                         <td style="padding: 8px 0; color: #6c757d; font-weight: 600;">Request ID:</td>
-                        <td style="padding: 8px 0; font-family: monospace;">{request_data.get('id', 'N/A')}</td>
+                        <td style="padding: 8px 0; font-family: monospace;">{display_id}</td>
                     </tr>
-                    {f"<tr><td style='padding: 8px 0; color: #6c757d; font-weight: 600;'>Workflow ID:</td><td style='padding: 8px 0; font-family: monospace;'>{request_data.get('metadata', {}).get('workflow_id', 'N/A')}</td></tr>" if request_data.get('metadata', {}).get('workflow_id') else ''}
+                    {workflow_row}
                     <tr>
                         <td style="padding: 8px 0; color: #6c757d; font-weight: 600;">Created:</td>
-                        <td style="padding: 8px 0;">{datetime.utcnow().strftime('%Y-%m-% d %H:%M UTC')}</td>
+                        <td style="padding: 8px 0;">{_utc_minute()}</td>
                     </tr>
                 </table>
             </div>
 
             <div style="text-align: center; margin: 30px 0;">
-                <a href="{dashboard_url}/requests/{request_data.get('id')}"
+                <a href="{view_url}"
                    style="display: inline-block; background-color: #3B82F6; color: white; padding: 12px 30px; text-decoration: none; border-radius: 4px; font-weight: 600;">
                     View Request →
                 </a>
@@ -62,14 +126,15 @@ def new_request_email(request_data: Dict[str, Any], dashboard_url: str) -> str:
             <p style="color: #6c757d; font-size: 14px; text-align: center; margin-top: 20px;">
                 Or visit: <a href="{dashboard_url}" style="color: #3B82F6;">{dashboard_url}</a>
             </p>
-        </div>
+        """
 
-        <div style="margin-top: 20px; padding: 15px; background-color: #f8f9fa; border-radius: 4px; text-align: center; color: #6c757d; font-size: 12px;">
-            <p style="margin: 0;">This is an automated notification from the HITL Service.</p>
-        </div>
-    </body>
-    </html>
-    """
+    return _page(
+        title="New Consultation Request",
+        accent="#3B82F6",
+        heading="New Consultation Request",
+        content=content,
+        footer_note="notification",
+    )
 
 
 def request_responded_email(
@@ -86,53 +151,64 @@ def request_responded_email(
     Returns:
         HTML email content
     """
-    decision_color = {
-        "approve": "#10B981",
-        "reject": "#EF4444",
-        "request_changes": "#F59E0B",
-    }.get(response_data.get("decision", ""), "#6B7280")
-
-    decision_label = response_data.get("decision", "unknown").replace("_", " ").title()
-
-    return f"""
-    <!DOCTYPE html>
-    <html>
-    <head>
-        <meta charset="utf-8">
-        <meta name="viewport" content="width=device-width, initial-scale=1.0">
-        <title>Response Submitted</title>
-    </head>
-    <body style="font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, 'Helvetica Neue', Arial, sans-serif; line-height: 1.6; color: #333; max-width: 600px; margin: 0 auto; padding: 20px;">
-        <div style="background-color: {decision_color}; color: white; padding: 20px; border-radius: 8px 8px 0 0;">
-            <h1 style="margin: 0; font-size: 24px;">✓ Response Submitted</h1>
-        </div>
-
-        <div style="background-color: #f8f9fa; padding: 20px; border: 1px solid #e9ecef; border-top: none; border-radius: 0 0 8px 8px;">
+    # Everything but the comment depends only on these (stringified) values,
+    # so that part comes from the cache on repeat renders (resends, retries);
+    # the comment is free text of any size and isn't worth keeping around
+    comment = response_data.get("comment")
+    comment_html = f"<div style='margin-top: 8px; color: #495057;'>{_text(comment)}</div>" if comment else ""
+    before, after = _render_responded(
+        str(response_data.get("decision", "unknown")),
+        str(request_data.get("title", "Untitled")),
+        str(request_data.get("id")),
+        str(dashboard_url),
+    )
+    return before + comment_html + after
+
+
+# Stands in for the comment in cached renders; split on to get the parts
+_COMMENT_SLOT = "\x00comment\x00"
+
+
+@lru_cache(maxsize=1024)
+def _render_responded(decision: str, title: str, request_id: str, dashboard_url: str) -> tuple[str, str]:
+    """Render request_responded_email around the comment, as (before, after)."""
+    try:
+        decision_color, decision_label = _DECISIONS[decision]
+    except KeyError:
+        decision_color = _UNKNOWN_DECISION_COLOR
+        decision_label = _text(decision.replace("_", " ").title())
+    comment_html = _COMMENT_SLOT
+    title = _text(title)
+    view_url = f"{dashboard_url}/requests/{_text(request_id)}"
+
+    content = f"""
             <p style="font-size: 16px; color: #495057;">Your response has been recorded and the agent has been notified.</p>
 
             <div style="background-color: white; padding: 15px; border-radius: 4px; margin: 20px 0;">
-                <h3 style="margin-top: 0; color: #495057; font-size: 16px;">Request: {request_data.get('title', 'Untitled')}</h3>
+                <h3 style="margin-top: 0; color: #495057; font-size: 16px;">Request: {title}</h3>
 
                 <div style="margin: 15px 0; padding: 12px; background-color: #f8f9fa; border-left: 4px solid {decision_color}; border-radius: 4px;">
                     <div style="font-weight: 600; color: {decision_color};">Decision: {decision_label}</div>
-                    {f"<div style='margin-top: 8px; color: #495057;'>{response_data.get('comment', '')}</div>" if response_data.get('comment') else ''}
+                    {comment_html}
                 </div>
             </div>
 
             <div style="text-align: center; margin: 30px 0;">
-                <a href="{dashboard_url}/requests/{request_data.get('id')}"
+                <a href="{view_url}"
                    style="display: inline-block; background-color: {decision_color}; color: white; padding: 12px 30px; text-decoration: none; border-radius: 4px; font-weight: 600;">
                     View Request →
                 </a>
             </div>
-        </div>
+        """
 
-        <div style="margin-top: 20px; padding: 15px; background-color: #f8f9fa; border-radius: 4px; text-align: center; color: #6c757d; font-size: 12px;">
-            <p style="margin: 0;">This is an automated confirmation from the HITL Service.</p>
-        </div>
-    </body>
-    </html>
-    """
+    before, _, after = _page(
+        title="Response Submitted",
+        accent=decision_color,
+        heading="✓ Response Submitted",
+        content=content,
+        footer_note="confirmation",
+    ).partition(_COMMENT_SLOT)
+    return before, after
 
 
 def request_timeout_email(request_data: Dict[str, Any], dashboard_url: str) -> str:
@@ -146,35 +222,29 @@ def request_timeout_email(request_data: Dict[str, Any], dashboard_url: str) -> s
     Returns:
         HTML email content
     """
-    return f"""
-    <!DOCTYPE html>
-    <html>
-    <head>
-        <meta charset="utf-8">
-        <meta name="viewport" content="width=device-width, initial-scale=1.0">
-        <title>Request Timed Out</title>
-    </head>
-    <body style="font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, 'Helvetica Neue', Arial, sans-serif; line-height: 1.6; color: #333; max-width: 600px; margin: 0 auto; padding: 20px;">
-        <div style="background-color: #EF4444; color: white; padding: 20px; border-radius: 8px 8px 0 0;">
-            <h1 style="margin: 0; font-size: 24px;">⚠️ Request Timed Out</h1>
-        </div>
-
-        <div style="background-color: #f8f9fa; padding: 20px; border: 1px solid #e9ecef; border-top: none; border-radius: 0 0 8px 8px;">
+    title = _text(request_data.get("title", "Untitled Request"))
+    description = request_data.get("description")
+    request_id = request_data.get("id")
+    display_id = _text(request_id or "N/A")
+    view_url = f"{dashboard_url}/requests/{_text(request_id)}"
+    description_html = f"<p style='color: #6c757d;'>{_text(description)}</p>" if description else ""
+
+    content = f"""
             <p style="font-size: 16px; color: #495057;">The following consultation request has timed out without a response.</p>
 
             <div style="background-color: white; padding: 15px; border-radius: 4px; margin: 20px 0;">
-                <h3 style="margin-top: 0; color: #495057; font-size: 16px;">{request_data.get('title', 'Untitled Request')}</h3>
+                <h3 style="margin-top: 0; color: #495057; font-size: 16px;">{title}</h3>
 
-                {f"<p style='color: #6c757d;'>{request_data.get('description', '')}</p>" if request_data.get('description') else ''}
+                {description_html}
 
                 <table style="width: 100%; border-collapse: collapse; margin-top: 15px;">
                     <tr>
                         <td style="padding: 8px 0; color: #6c757d; font-weight: 600;">Request ID:</td>
-                        <td style="padding: 8px 0; font-family: monospace;">{request_data.get('id', 'N/A')}</td>
+                        <td style="padding: 8px 0; font-family: monospace;">{display_id}</td>
                     </tr>
                     <tr>
                         <td style="padding: 8px 0; color: #6c757d; font-weight: 600;">Timeout:</td>
-                        <td style="padding: 8px 0;">{datetime.utcnow().strftime('%Y-%m-%d %H:%M UTC')}</td>
+                        <td style="padding: 8px 0;">{_utc_minute()}</td>
                     </tr>
                 </table>
             </div>
@@ -186,16 +256,17 @@ def request_timeout_email(request_data: Dict[str, Any], dashboard_url: str) -> s
             </div>
 
             <div style="text-align: center; margin: 30px 0;">
-                <a href="{dashboard_url}/requests/{request_data.get('id')}"
+                <a href="{view_url}"
                    style="display: inline-block; background-color: #EF4444; color: white; padding: 12px 30px; text-decoration: none; border-radius: 4px; font-weight: 600;">
                     View Request →
                 </a>
             </div>
-        </div>
-
-        <div style="margin-top: 20px; padding: 15px; background-color: #f8f9fa; border-radius: 4px; text-align: center; color: #6c757d; font-size: 12px;">
-            <p style="margin: 0;">This is an automated notification from the HITL Service.</p>
-        </div>
-    </body>
-    </html>
-    """
+        """
+
+    return _page(
+        title="Request Timed Out",
+        accent="#EF4444",
+        heading="⚠️ Request Timed Out",
+        content=content,
+        footer_note="notification",
+    )
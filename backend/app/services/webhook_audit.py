@@ -0,0 +1,177 @@
+"""
+Webhook delivery audit log writer.
+
+Webhook attempts are logged to `webhook_deliveries` in the background instead of
+with one INSERT + commit per attempt. Callers push records onto a bounded queue;
+a single consumer task drains it in batches:
+
+- Batches of COPY_THRESHOLD rows or more are written with PostgreSQL COPY
+  (asyncpg `copy_records_to_table`)
+- Smaller batches use a single multi-row INSERT ... VALUES statement
+
+This keeps webhook latency independent of database latency and avoids a burst
+of single-row writes (and WAL traffic) during retry storms.
+"""
+
+import asyncio
+import logging
+from typing import Any, NamedTuple, Optional
+from uuid import UUID
+
+import orjson
+from sqlalchemy import insert
+from uuid6 import uuid7
+
+from app.db.session import engine
+from app.models import WebhookDelivery
+
+logger = logging.getLogger(__name__)
+
+# Flush as soon as this many rows are pending (and use COPY for them)
+COPY_THRESHOLD = 100
+
+# Otherwise flush whatever is pending after this many seconds
+FLUSH_INTERVAL = 0.5
+
+# Upper bound on pending rows; producers wait when the queue is full
+MAX_PENDING = 10_000
+
+COLUMNS = (
+    "id",
+    "request_id",
+    "webhook_url",
+    "payload",
+    "status_code",
+    "response_body",
+    "error",
+    "retry_count",
+)
+
+
+class DeliveryRecord(NamedTuple):
+    """One webhook delivery attempt, as queued for the audit log."""
+
+    request_id: UUID
+    webhook_url: str
+    payload: dict[str, Any]
+    status_code: Optional[int]
+    response_body: Optional[str]
+    error: Optional[str]
+    retry_count: int
+
+
+_queue: Optional["asyncio.Queue[DeliveryRecord]"] = None
+_consumer: Optional["asyncio.Task[None]"] = None
+
+
+async def record_delivery(record: DeliveryRecord) -> None:
+    """
+    Queue a delivery attempt for the audit log.
+
+    If the background writer isn't running (scripts, tests), the record is
+    written immediately instead.
+    """
+    await record_deliveries([record])
+
+
+async def record_deliveries(records: list[DeliveryRecord]) -> None:
+    """Queue several delivery attempts (e.g. all retries of one webhook) at once."""
+    if not records:
+        return
+
+    if _queue is None:
+        await _write_batch(records)
+        return
+
+    for record in records:
+        await _queue.put(record)
+
+
+async def start() -> None:
+    """Start the background writer (called from the app lifespan)."""
+    global _queue, _consumer
+
+    if _consumer is not None:
+        return
+
+    _queue = asyncio.Queue(maxsize=MAX_PENDING)
+    _consumer = asyncio.create_task(_consume(_queue), name="webhook-audit-writer")
+    logger.info("Webhook audit writer started")
+
+
+async def stop() -> None:
+    """Flush pending records and stop the background writer."""
+    global _queue, _consumer
+
+    if _queue is None or _consumer is None:
+        return
+
+    # Let the consumer drain everything that's already queued
+    await _queue.join()
+    _consumer.cancel()
+    try:
+        await _consumer
+    except asyncio.CancelledError:
+        pass
+
+    _queue = None
+    _consumer = None
+    logger.info("Webhook audit writer stopped")
+
+
+async def _consume(queue: "asyncio.Queue[DeliveryRecord]") -> None:
+    """Drain the queue in batches of up to COPY_THRESHOLD rows or FLUSH_INTERVAL."""
+    loop = asyncio.get_running_loop()
+
+    while True:
+        batch = [await queue.get()]
+        deadline = loop.time() + FLUSH_INTERVAL
+
+        while len(batch) < COPY_THRESHOLD:
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+
+        try:
+            await _write_batch(batch)
+        except Exception:
+            logger.exception(f"Failed to write {len(batch)} webhook delivery record(s)")
+        finally:
+            for _ in batch:
+                queue.task_done()
+
+
+async def _write_batch(batch: list[DeliveryRecord]) -> None:
+    """Write a batch of delivery records in a single round-trip."""
+    async with engine.begin() as conn:
+        if len(batch) >= COPY_THRESHOLD:
+            raw_conn = await conn.get_raw_connection()
+            await raw_conn.driver_connection.copy_records_to_table(
+                WebhookDelivery.__tablename__,
+                records=[
+                    (
+                        uuid7(),
+                        r.request_id,
+                        r.webhook_url,
+                        orjson.dumps(r.payload).decode(),  # asyncpg's json codec expects text
+                        r.status_code,
+                        r.response_body,
+                        r.error,
+                        r.retry_count,
+                    )
+                    for r in batch
+                ],
+                columns=COLUMNS,
+            )
+        else:
+            # One INSERT ... VALUES (...), (...) statement for the whole batch
+            # (a plain executemany would still send one INSERT per row)
+            await conn.execute(
+                insert(WebhookDelivery.__table__).values(
+                    [record._asdict() for record in batch]
+                )
+            )
@@ -0,0 +1,244 @@
+"""
+Agent webhook delivery.
+
+When a human responds to a request, the agent is notified by POSTing to the
+request's callback_webhook. Deliveries run in one of two modes:
+
+- In-process (default): `call_agent_webhook` runs as a FastAPI background
+  task and retries with exponential backoff inside the API process.
+- Durable queue (WEBHOOK_QUEUE_ENABLED=true): the API only appends the
+  request ID to a Redis stream (`enqueue_webhook`); a separate worker
+  process (app.workers.webhook_worker) makes the attempts and schedules
+  retries. Slow or hanging agent endpoints then never share the event loop
+  with user-facing requests, and pending deliveries survive API restarts.
+
+Every attempt is logged to webhook_deliveries via the audit writer.
+"""
+
+import asyncio
+from typing import Any, Optional
+from uuid import UUID
+
+import httpx
+from cachetools import TTLCache
+from sqlalchemy import func, update
+
+from app.core.security import encode_webhook_payload, sign_webhook_body
+from app.db.redis import get_redis
+from app.db.session import AsyncSessionLocal
+from app.models import ConsultationRequest
+from app.services.webhook_audit import DeliveryRecord, record_deliveries, record_delivery
+
+# Total attempts per webhook (first try + retries), backoff 1s, 2s, ...
+MAX_ATTEMPTS = 3
+
+# Redis stream the API appends to and the webhook worker consumes
+WEBHOOK_STREAM = "webhooks"
+
+# Cap on stream length (acknowledged entries are trimmed approximately)
+WEBHOOK_STREAM_MAXLEN = 100_000
+
+# Webhooks built by the worker, keyed by request ID, so retries resend the
+# same signed body instead of re-encoding and re-signing it. A responded
+# request's payload never changes. Entries are dropped once delivery is
+# settled; the TTL cleans up after attempts that moved to another worker.
+_built_webhooks: TTLCache = TTLCache(maxsize=10_000, ttl=300)
+
+# Shared HTTP client for agent webhooks.
+# Reusing one pooled client keeps connections (and TLS sessions) alive across
+# retries and across deliveries to the same agent host.
+_webhook_client: Optional[httpx.AsyncClient] = None
+
+
+def get_webhook_client() -> httpx.AsyncClient:
+    """Return the shared webhook HTTP client, creating it on first use."""
+    global _webhook_client
+
+    if _webhook_client is None:
+        _webhook_client = httpx.AsyncClient(
+            http2=True,
+            timeout=30.0,
+            limits=httpx.Limits(max_connections=200, max_keepalive_connections=50),
+        )
+    return _webhook_client
+
+
+async def close_webhook_client() -> None:
+    """Close the shared webhook HTTP client (called on shutdown)."""
+    global _webhook_client
+
+    if _webhook_client is not None:
+        await _webhook_client.aclose()
+        _webhook_client = None
+
+
+async def enqueue_webhook(request_id: UUID, attempt: int = 0) -> None:
+    """Queue a webhook delivery for the webhook worker."""
+    await get_redis().xadd(
+        WEBHOOK_STREAM,
+        {"request_id": str(request_id), "attempt": attempt},
+        maxlen=WEBHOOK_STREAM_MAXLEN,
+        approximate=True,
+    )
+
+
+def build_webhook(
+    request: ConsultationRequest,
+) -> tuple[dict[str, Any], bytes, dict[str, str]]:
+    """Build the webhook payload, encoded body and headers for a responded request.
+
+    The body is encoded and signed once; every attempt sends these exact
+    bytes, so the signature always matches what the agent receives.
+    """
+    payload = {
+        "event": "request.responded",
+        "request_id": str(request.id),
+        "metadata": request.request_metadata or {},
+        "response": request.response,
+    }
+
+    body = encode_webhook_payload(payload)
+
+    # Create signature if secret provided
+    headers = {"Content-Type": "application/json"}
+    if request.callback_secret:
+        signature = sign_webhook_body(body, request.callback_secret)
+        headers["X-Webhook-Signature"] = signature
+
+    return payload, body, headers
+
+
+async def send_webhook(
+    request: ConsultationRequest,
+    payload: dict[str, Any],
+    body: bytes,
+    headers: dict[str, str],
+    attempt: int,
+) -> DeliveryRecord:
+    """Make one delivery attempt and return its audit record.
+
+    `body` is the encoded payload (see build_webhook); `payload` is only
+    kept for the audit log.
+
+    A record with error=None means the agent accepted the webhook.
+    """
+    try:
+        response = await get_webhook_client().post(
+            request.callback_webhook,
+            content=body,
+            headers=headers,
+        )
+        response.raise_for_status()
+
+        return DeliveryRecord(
+            request_id=request.id,
+            webhook_url=request.callback_webhook,
+            payload=payload,
+            status_code=response.status_code,
+            response_body=response.text[:1000],  # Limit size
+            error=None,
+            retry_count=attempt,
+        )
+
+    except Exception as e:
+        return DeliveryRecord(
+            request_id=request.id,
+            webhook_url=request.callback_webhook,
+            payload=payload,
+            status_code=None,
+            response_body=None,
+            error=str(e)[:1000],
+            retry_count=attempt,
+        )
+
+
+async def _load_request(request_id: UUID) -> Optional[ConsultationRequest]:
+    """Load a request in a short session of its own.
+
+    The session (and its pooled connection) is released before the caller
+    makes any HTTP calls; the returned object keeps its loaded attributes
+    (sessions don't expire on commit/close).
+    """
+    async with AsyncSessionLocal() as db:
+        return await db.get(ConsultationRequest, request_id)
+
+
+async def _settle(request_id: UUID, delivered: bool) -> None:
+    """Record the final delivery state with one conditional UPDATE.
+
+    Only a request still in "responded" is updated, so a state another
+    process set in the meantime is never overwritten.
+    """
+    values: dict[str, Any] = {"state": "callback_sent" if delivered else "callback_failed"}
+    if delivered:
+        values["callback_sent_at"] = func.now()
+
+    async with AsyncSessionLocal() as db:
+        await db.execute(
+            update(ConsultationRequest)
+            .where(
+                ConsultationRequest.id == request_id,
+                ConsultationRequest.state == "responded",
+            )
+            .values(**values)
+        )
+        await db.commit()
+
+
+async def call_agent_webhook(request_id: UUID):
+    """Background task to call agent's webhook.
+
+    Retries up to 3 times with exponential backoff. No database connection
+    is held during the attempts or the backoff sleeps; the request state
+    and the audit log are written once, after the final attempt.
+    """
+    request = await _load_request(request_id)
+    if not request or not request.callback_webhook:
+        return
+
+    payload, body, headers = build_webhook(request)
+
+    # Retry logic
+    attempts: list[DeliveryRecord] = []
+    for attempt in range(MAX_ATTEMPTS):
+        record = await send_webhook(request, payload, body, headers, attempt)
+        attempts.append(record)
+
+        if record.error is None:
+            break  # Success!
+
+        if attempt < MAX_ATTEMPTS - 1:
+            # Exponential backoff: 1s, 2s
+            await asyncio.sleep(2 ** attempt)
+
+    await _settle(request_id, delivered=attempts[-1].error is None)
+    await record_deliveries(attempts)
+
+
+async def attempt_webhook(request_id: UUID, attempt: int) -> bool:
+    """Make a single delivery attempt (used by the webhook worker).
+
+    Updates the request state on success or on the final failed attempt.
+    The database is only touched before and after the HTTP call, so a slow
+    agent never holds a pooled connection.
+
+    Returns:
+        True if the attempt failed and another one should be scheduled
+    """
+    request = await _load_request(request_id)
+    if not request or not request.callback_webhook or request.state != "responded":
+        _built_webhooks.pop(request_id, None)
+        return False  # Deleted, no webhook, or already delivered
+
+    built = _built_webhooks.get(request_id)
+    if built is None:
+        built = _built_webhooks[request_id] = build_webhook(request)
+    record = await send_webhook(request, *built, attempt)
+
+    retry = record.error is not None and attempt < MAX_ATTEMPTS - 1
+    if not retry:
+        _built_webhooks.pop(request_id, None)
+        await _settle(request_id, delivered=record.error is None)
+
+    await record_delivery(record)
+    return retry
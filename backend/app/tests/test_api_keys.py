@@ -0,0 +1,38 @@
+"""Tests for API key generation and parsing (app.core.security)."""
+
+from uuid import uuid4
+
+import pytest
+
+from app.core.security import API_KEY_PREFIX, generate_api_key, parse_api_key_id
+
+
+def test_generated_key_embeds_id():
+    """A generated key parses back to the row ID it was made for."""
+    key_id = uuid4()
+
+    key = generate_api_key(key_id)
+
+    assert key.startswith(f"{API_KEY_PREFIX}{key_id}.")
+    assert parse_api_key_id(key) == key_id
+
+
+def test_generated_keys_are_unique():
+    key_id = uuid4()
+
+    assert generate_api_key(key_id) != generate_api_key(key_id)
+
+
+@pytest.mark.parametrize(
+    "key",
+    [
+        "hKj8sH3nX92lP4mN6vB1qW0zR5tY7u",  # legacy: plain random string
+        f"{API_KEY_PREFIX}{uuid4()}",  # no secret part
+        f"{API_KEY_PREFIX}not-a-uuid.secret",
+        f"xx_{uuid4()}.secret",
+        "",
+    ],
+)
+def test_parse_returns_none_for_other_keys(key):
+    """Legacy and malformed keys have no embedded ID (and don't raise)."""
+    assert parse_api_key_id(key) is None
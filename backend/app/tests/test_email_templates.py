@@ -0,0 +1,45 @@
+"""Tests for HTML escaping in email templates (app.services.email.templates)."""
+
+from app.services.email.templates import (
+    _text,
+    new_request_email,
+    request_responded_email,
+)
+
+
+def test_text_escapes_markup():
+    assert _text('<script>alert("x")</script>') == (
+        "&lt;script&gt;alert(&quot;x&quot;)&lt;/script&gt;"
+    )
+
+
+def test_text_escapes_attribute_quotes():
+    assert _text("a' onmouseover='x") == "a&#x27; onmouseover=&#x27;x"
+
+
+def test_text_stringifies_values():
+    assert _text(None) == "None"
+    assert _text(42) == "42"
+    assert _text(["<a>"]) == "[&#x27;&lt;a&gt;&#x27;]"
+
+
+def test_new_request_email_escapes_user_values():
+    html = new_request_email(
+        {"title": "<b>title</b>", "description": "<i>desc</i>", "id": "1"},
+        "http://localhost:3000",
+    )
+
+    assert "<b>title</b>" not in html
+    assert "&lt;b&gt;title&lt;/b&gt;" in html
+    assert "&lt;i&gt;desc&lt;/i&gt;" in html
+
+
+def test_responded_email_escapes_comment_and_accepts_unhashable_values():
+    html = request_responded_email(
+        {"title": ["list", "title"], "id": "1"},
+        {"decision": "approve", "comment": "<img src=x>"},
+        "http://localhost:3000",
+    )
+
+    assert "&lt;img src=x&gt;" in html
+    assert "<img src=x>" not in html
@@ -6,14 +6,21 @@ This demonstrates production-ready testing practices:
 3. Clear test structure (Arrange, Act, Assert)
 """
 
+import pytest
+from fastapi.middleware.cors import CORSMiddleware
 from fastapi.testclient import TestClient
 
 from app.main import app
 
-client = TestClient(app)
 
+@pytest.fixture(scope="session")
+def client():
+    """One client (and one app startup/shutdown) shared by all tests."""
+    with TestClient(app) as c:
+        yield c
 
-def test_health_check():
+
+def test_health_check(client):
     """Test health check endpoint returns correct status."""
     # Act
     response = client.get("/health")
@@ -26,7 +33,7 @@ def test_health_check():
     assert "environment" in data
 
 
-def test_root_endpoint():
+def test_root_endpoint(client):
     """Test root endpoint returns welcome message."""
     # Act
     response = client.get("/")
@@ -39,12 +46,12 @@ def test_root_endpoint():
 
 
 def test_cors_headers():
-    """Test CORS headers are properly configured."""
-    # Act
-    response = client.options(
-        "/health",
-        headers={"Origin": "http://localhost:3000"},
-    )
-
-    # Assert - CORS headers should be present
-    assert "access-control-allow-origin" in response.headers
+    """Test CORS is configured for the frontend origin."""
+    # The middleware is configured statically, so check its settings
+    # directly instead of sending a request through the ASGI stack
+    cors = [mw for mw in app.user_middleware if mw.cls is CORSMiddleware]
+
+    # Assert - CORS middleware installed and allowing the frontend origin
+    assert len(cors) == 1
+    assert "http://localhost:3000" in cors[0].kwargs["allow_origins"]
+    assert "X-Next-Cursor" in cors[0].kwargs["expose_headers"]
@@ -0,0 +1,82 @@
+"""Tests for keyset pagination cursors (app.api.pagination)."""
+
+import base64
+from datetime import datetime, timezone
+from uuid import uuid4
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+
+from app.api.pagination import apply_keyset, decode_cursor, encode_cursor
+from app.db.base import ConsultationRequest
+
+
+def _sql(query) -> str:
+    return str(query.compile(dialect=postgresql.dialect()))
+
+
+def test_cursor_round_trip():
+    """A cursor decodes to the position it was encoded from."""
+    created_at = datetime(2024, 5, 1, 12, 30, 15, 123456, tzinfo=timezone.utc)
+    id = uuid4()
+
+    cursor = encode_cursor(created_at, id)
+
+    assert "=" not in cursor
+    assert decode_cursor(cursor) == (created_at, id)
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        "not a cursor!",
+        base64.urlsafe_b64encode(b"no separator").decode(),
+        base64.urlsafe_b64encode(b"2024-05-01T12:00:00|not-a-uuid").decode(),
+        base64.urlsafe_b64encode(f"yesterday|{uuid4()}".encode()).decode(),
+        base64.urlsafe_b64encode(b"\xff\xfe|\xff").decode(),
+    ],
+)
+def test_malformed_cursor_is_400(cursor):
+    """Garbage or tampered cursors are rejected as bad requests."""
+    with pytest.raises(HTTPException) as exc_info:
+        decode_cursor(cursor)
+
+    assert exc_info.value.status_code == 400
+
+
+def test_tampered_cursor_is_400():
+    """Changing characters in a valid cursor doesn't yield a server error."""
+    cursor = encode_cursor(datetime.now(timezone.utc), uuid4())
+
+    with pytest.raises(HTTPException) as exc_info:
+        decode_cursor(cursor[:-6] + "!!!!!!")
+
+    assert exc_info.value.status_code == 400
+
+
+def test_apply_keyset_orders_with_id_tie_break():
+    """Rows sharing a created_at are ordered (and paged) by id."""
+    sql = _sql(apply_keyset(select(ConsultationRequest), ConsultationRequest, None))
+
+    assert "WHERE" not in sql
+    assert sql.endswith(
+        "ORDER BY consultation_requests.created_at DESC, consultation_requests.id DESC"
+    )
+
+
+def test_apply_keyset_starts_after_cursor():
+    """The next page compares (created_at, id) as a row, not created_at alone."""
+    cursor = encode_cursor(datetime.now(timezone.utc), uuid4())
+
+    sql = _sql(apply_keyset(select(ConsultationRequest), ConsultationRequest, cursor))
+
+    assert "(consultation_requests.created_at, consultation_requests.id) < (" in sql
+
+
+def test_apply_keyset_rejects_malformed_cursor():
+    with pytest.raises(HTTPException) as exc_info:
+        apply_keyset(select(ConsultationRequest), ConsultationRequest, "bogus")
+
+    assert exc_info.value.status_code == 400
@@ -0,0 +1,237 @@
+"""Webhook delivery worker.
+
+Consumes the Redis stream that the API appends to when WEBHOOK_QUEUE_ENABLED
+is set (see app.services.webhooks), so agent callbacks run outside the API
+process.
+
+How it works:
+1. Each stream entry is one delivery attempt: {"request_id", "attempt"}
+2. Workers read entries with XREADGROUP (consumer group, so several workers
+   can run side by side) and XACK them once the attempt is handled
+3. A failed attempt is scheduled for retry in a sorted set scored by due
+   time (exponential backoff: 1s, 2s, ...); due retries are moved back onto
+   the stream atomically by a small Lua script
+4. Entries left unacknowledged by a crashed worker (or a crashed attempt)
+   are reclaimed with XAUTOCLAIM after CLAIM_IDLE_MS; an entry delivered
+   MAX_DELIVERIES times without being acknowledged is moved to the
+   DEAD_LETTER_STREAM instead of being retried forever
+
+Usage:
+    python -m app.workers.webhook_worker
+"""
+
+import asyncio
+import logging
+import os
+import signal
+import socket
+import time
+from uuid import UUID
+
+from redis.exceptions import ResponseError
+
+from app.core.logging_config import setup_logging
+from app.db.redis import close_redis, get_redis
+from app.db.session import engine
+from app.services import webhook_audit
+from app.services.webhooks import (
+    WEBHOOK_STREAM,
+    WEBHOOK_STREAM_MAXLEN,
+    attempt_webhook,
+    close_webhook_client,
+)
+
+logger = logging.getLogger(__name__)
+
+# Consumer group shared by all webhook workers
+GROUP = "webhook-workers"
+
+# Sorted set of scheduled retries: member "<request_id>:<attempt>", score = due time
+RETRY_KEY = "webhooks:retry"
+
+# Entries read per XREADGROUP call (attempts in a batch run concurrently)
+BATCH_SIZE = 50
+
+# How long XREADGROUP blocks waiting for new entries (ms)
+BLOCK_MS = 1000
+
+# Reclaim entries a dead consumer left unacknowledged for this long (ms)
+CLAIM_IDLE_MS = 60_000
+
+# Deliveries (reads + reclaims) after which an unacknowledged entry is
+# dead-lettered rather than attempted again
+MAX_DELIVERIES = 5
+
+# Stream that dead-lettered entries are copied to (with their original ID)
+DEAD_LETTER_STREAM = "webhooks:dead"
+
+# How often to look for due retries (seconds)
+RETRY_POLL_INTERVAL = 0.5
+
+# Move due retries from the sorted set back onto the stream.
+# Runs atomically in Redis, so a retry is never lost or enqueued twice
+# even with several workers polling.
+PROMOTE_RETRIES = """
+local due = redis.call('ZRANGEBYSCORE', KEYS[1], '-inf', ARGV[1], 'LIMIT', 0, ARGV[2])
+for _, member in ipairs(due) do
+    local request_id, attempt = string.match(member, '^(.+):(%d+)$')
+    redis.call('ZREM', KEYS[1], member)
+    redis.call('XADD', KEYS[2], 'MAXLEN', '~', ARGV[3], '*',
+               'request_id', request_id, 'attempt', attempt)
+end
+return #due
+"""
+
+
+async def handle_entry(entry_id: str, fields: dict[str, str]) -> None:
+    """Make one delivery attempt for a stream entry, then acknowledge it."""
+    redis = get_redis()
+
+    try:
+        request_id = UUID(fields["request_id"])
+        attempt = int(fields["attempt"])
+    except (KeyError, ValueError):
+        logger.error(f"Dropping malformed webhook entry {entry_id}: {fields}")
+        await redis.xack(WEBHOOK_STREAM, GROUP, entry_id)
+        return
+
+    try:
+        retry = await attempt_webhook(request_id, attempt)
+    except Exception:
+        # Leave the entry pending; it is reclaimed after CLAIM_IDLE_MS (and
+        # dead-lettered once it has been delivered MAX_DELIVERIES times)
+        logger.exception(f"Webhook attempt {attempt} for request {request_id} crashed")
+        return
+
+    if retry:
+        due = time.time() + 2 ** attempt
+        await redis.zadd(RETRY_KEY, {f"{request_id}:{attempt + 1}": due})
+
+    await redis.xack(WEBHOOK_STREAM, GROUP, entry_id)
+
+
+async def reclaim_entries(consumer: str) -> list[tuple[str, dict[str, str]]]:
+    """Claim entries other consumers left pending, and return the ones to retry.
+
+    Claimed entries that were trimmed from the stream (no fields) and
+    entries already delivered MAX_DELIVERIES times are acknowledged here so
+    they leave the pending list; the latter are kept in DEAD_LETTER_STREAM.
+    """
+    redis = get_redis()
+
+    claimed = await redis.xautoclaim(
+        WEBHOOK_STREAM, GROUP, consumer, CLAIM_IDLE_MS, count=BATCH_SIZE
+    )
+    # [next_id, entries(, deleted_ids on Redis 7+)]; trimmed entries have no fields
+    entries = [entry for entry in claimed[1] if entry[1]]
+    trimmed = [entry_id for entry_id, fields in claimed[1] if not fields]
+    if trimmed:
+        await redis.xack(WEBHOOK_STREAM, GROUP, *trimmed)
+
+    if not entries:
+        return entries
+
+    pending = await redis.xpending_range(
+        WEBHOOK_STREAM,
+        GROUP,
+        min=entries[0][0],
+        max=entries[-1][0],
+        count=len(entries),
+        consumername=consumer,
+    )
+    deliveries = {p["message_id"]: p["times_delivered"] for p in pending}
+
+    live = []
+    for entry_id, fields in entries:
+        if deliveries.get(entry_id, 0) < MAX_DELIVERIES:
+            live.append((entry_id, fields))
+            continue
+
+        logger.error(
+            f"Dead-lettering webhook entry {entry_id} after "
+            f"{deliveries[entry_id]} deliveries: {fields}"
+        )
+        await redis.xadd(DEAD_LETTER_STREAM, {**fields, "entry_id": entry_id})
+        await redis.xack(WEBHOOK_STREAM, GROUP, entry_id)
+
+    return live
+
+
+async def promote_retries(stop: asyncio.Event) -> None:
+    """Periodically move due retries back onto the stream."""
+    promote = get_redis().register_script(PROMOTE_RETRIES)
+
+    while not stop.is_set():
+        try:
+            await promote(
+                keys=[RETRY_KEY, WEBHOOK_STREAM],
+                args=[time.time(), BATCH_SIZE, WEBHOOK_STREAM_MAXLEN],
+            )
+        except Exception:
+            logger.exception("Failed to promote webhook retries")
+
+        try:
+            await asyncio.wait_for(stop.wait(), RETRY_POLL_INTERVAL)
+        except asyncio.TimeoutError:
+            pass
+
+
+async def run(stop: asyncio.Event) -> None:
+    """Consume the webhook stream until `stop` is set."""
+    redis = get_redis()
+    consumer = f"{socket.gethostname()}-{os.getpid()}"
+
+    try:
+        await redis.xgroup_create(WEBHOOK_STREAM, GROUP, id="0", mkstream=True)
+    except ResponseError as e:
+        if "BUSYGROUP" not in str(e):
+            raise
+
+    promoter = asyncio.create_task(promote_retries(stop), name="webhook-retry-promoter")
+    last_claim = 0.0
+    logger.info(f"Webhook worker {consumer} started")
+
+    try:
+        while not stop.is_set():
+            entries: list[tuple[str, dict[str, str]]] = []
+
+            # Pick up work abandoned by crashed workers
+            if time.monotonic() - last_claim > CLAIM_IDLE_MS / 1000:
+                last_claim = time.monotonic()
+                entries = await reclaim_entries(consumer)
+
+            if not entries:
+                response = await redis.xreadgroup(
+                    GROUP, consumer, {WEBHOOK_STREAM: ">"}, count=BATCH_SIZE, block=BLOCK_MS
+                )
+                for _, stream_entries in response:
+                    entries.extend(stream_entries)
+
+            if entries:
+                await asyncio.gather(*(handle_entry(*entry) for entry in entries))
+    finally:
+        stop.set()
+        await promoter
+        logger.info(f"Webhook worker {consumer} stopped")
+
+
+async def main() -> None:
+    """Run the worker until SIGINT/SIGTERM, then shut down cleanly."""
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop.set)
+
+    await webhook_audit.start()
+    try:
+        await run(stop)
+    finally:
+        await close_webhook_client()
+        await webhook_audit.stop()  # Flush pending webhook audit records
+        await close_redis()
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    setup_logging()
+    asyncio.run(main())
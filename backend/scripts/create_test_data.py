@@ -9,63 +9,148 @@ Usage:
     python -m scripts.create_test_data
 """
 
+import asyncio
 import sys
 from pathlib import Path
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from app.db.session import SessionLocal
+from sqlalchemy import exists, insert, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from uuid6 import uuid7
+
+from app.db.session import AsyncSessionLocal
 from app.models import User, APIKey, ConsultationRequest
+from app.core.config import settings
 from app.core.security import hash_password, generate_api_key, hash_api_key
 
-def create_test_data():
+# Precomputed argon2id hash of the dev password ("password123"), so seeding a
+# development database skips the deliberately slow KDF. Other environments
+# hash it fresh (own salt, current parameters).
+_DEV_PASSWORD_HASH = (
+    "$argon2id$v=19$m=65536,t=2,p=4$L2Xs/b8XAuA8J+QcY0zpvQ$KR68g+99GcYmSRFirfS3G3BzLFBMOC15f3WBWaG5MhQ"
+)
+
+# Sample consultation requests (column values for one bulk INSERT)
+_SAMPLE_REQUESTS = [
+    # Sample 1: Pending request
+    dict(
+        title="Review High-Risk Database Schema Changes",
+        description="Complaint #42 requires changes to the users table schema",
+        context={
+            "code_diff": """
+@@ -10,6 +10,7 @@ CREATE TABLE users (
+     email VARCHAR(255) UNIQUE NOT NULL,
+     name VARCHAR(255),
++    phone VARCHAR(20),
+     created_at TIMESTAMP DEFAULT NOW()
+);
+            """.strip(),
+            "risk_level": "high",
+            "affected_tables": ["users"],
+            "estimated_impact": "5000 active users"
+        },
+        callback_webhook="https://httpbin.org/post",  # Test webhook
+        state="pending",
+        request_metadata={
+            "workflow_id": "wf-test-001",
+            "checkpoint_id": "cp-schema-review",
+            "agent_id": "test-agent"
+        }
+    ),
+    # Sample 2: Another pending request
+    dict(
+        title="Approve Deployment to Production",
+        description="Code review passed, ready for production deployment",
+        context={
+            "commit_sha": "abc123def456",
+            "branch": "feature/new-payment-flow",
+            "tests_passed": True,
+            "code_coverage": "94%"
+        },
+        callback_webhook="https://httpbin.org/post",
+        state="pending",
+        request_metadata={
+            "workflow_id": "wf-test-002",
+            "checkpoint_id": "cp-deploy-approval",
+            "agent_id": "test-agent"
+        }
+    ),
+]
+
+
+async def create_test_data():
     """Create test data."""
-    db = SessionLocal()
+    async with AsyncSessionLocal() as db:
+        await _create_test_data(db)
+
 
+async def _create_test_data(db):
+    """Populate the database using the given session."""
     try:
         print("🚀 Creating test data...")
 
         # 1. Create test user
         print("\n1. Creating test user...")
-        existing_user = db.query(User).filter(User.email == "reviewer@example.com").first()
 
-        if existing_user:
-            print("   ✓ Test user already exists")
-            test_user = existing_user
+        # Outside development the password hash is the slow part, so only
+        # compute it when the user doesn't exist yet
+        if settings.ENVIRONMENT == "development":
+            hashed_password = _DEV_PASSWORD_HASH
+        elif await db.scalar(select(exists().where(User.email == "reviewer@example.com"))):
+            hashed_password = None
         else:
-            test_user = User(
-                email="reviewer@example.com",
-                name="Test Reviewer",
-                hashed_password=hash_password("password123"),
-                role="reviewer"
+            hashed_password = hash_password("password123")
+
+        # INSERT ... ON CONFLICT (email) DO NOTHING: one round-trip, and safe
+        # if another seeder runs concurrently. RETURNING is empty when the
+        # user already existed.
+        created_user_id = None
+        if hashed_password is not None:
+            created_user_id = await db.scalar(
+                pg_insert(User)
+                .values(
+                    email="reviewer@example.com",
+                    name="Test Reviewer",
+                    hashed_password=hashed_password,
+                    role="reviewer",
+                )
+                .on_conflict_do_nothing(index_elements=[User.email])
+                .returning(User.id)
             )
-            db.add(test_user)
-            db.commit()
-            db.refresh(test_user)
-            print(f"   ✓ Created user: {test_user.email}")
+            await db.commit()
+
+        if created_user_id is None:
+            print("   ✓ Test user already exists")
+        else:
+            print(f"   ✓ Created user: reviewer@example.com")
             print(f"   📧 Email: reviewer@example.com")
             print(f"   🔑 Password: password123")
 
         # 2. Create test API key
         print("\n2. Creating test API key...")
-        existing_key = db.query(APIKey).filter(APIKey.name == "test-agent").first()
 
-        if existing_key:
+        # API key names aren't unique, so there's no conflict target to
+        # insert against - check with EXISTS (no row is loaded)
+        key_exists = await db.scalar(select(exists().where(APIKey.name == "test-agent")))
+
+        if key_exists:
             print("   ✓ Test API key already exists")
             print(f"   ⚠️  Cannot show the raw key (it was only shown once)")
         else:
-            raw_key = generate_api_key()
+            key_id = uuid7()
+            raw_key = generate_api_key(key_id)
             key_hash = hash_api_key(raw_key)
 
             test_api_key = APIKey(
+                id=key_id,
                 key_hash=key_hash,
                 name="test-agent",
                 description="Test API key for development"
             )
             db.add(test_api_key)
-            db.commit()
-            db.refresh(test_api_key)
+            await db.commit()
 
             print(f"   ✓ Created API key: {test_api_key.name}")
             print(f"   🔑 RAW KEY (save this!): {raw_key}")
@@ -74,55 +159,12 @@ def create_test_data():
         # 3. Create sample consultation requests
         print("\n3. Creating sample consultation requests...")
 
-        # Sample 1: Pending request
-        sample1 = ConsultationRequest(
-            title="Review High-Risk Database Schema Changes",
-            description="Complaint #42 requires changes to the users table schema",
-            context={
-                "code_diff": """
-@@ -10,6 +10,7 @@ CREATE TABLE users (
-     email VARCHAR(255) UNIQUE NOT NULL,
-     name VARCHAR(255),
-+    phone VARCHAR(20),
-     created_at TIMESTAMP DEFAULT NOW()
-);
-                """.strip(),
-                "risk_level": "high",
-                "affected_tables": ["users"],
-                "estimated_impact": "5000 active users"
-            },
-            callback_webhook="https://httpbin.org/post",  # Test webhook
-            state="pending",
-            metadata={
-                "workflow_id": "wf-test-001",
-                "checkpoint_id": "cp-schema-review",
-                "agent_id": "test-agent"
-            }
-        )
-        db.add(sample1)
-
-        # Sample 2: Another pending request
-        sample2 = ConsultationRequest(
-            title="Approve Deployment to Production",
-            description="Code review passed, ready for production deployment",
-            context={
-                "commit_sha": "abc123def456",
-                "branch": "feature/new-payment-flow",
-                "tests_passed": True,
-                "code_coverage": "94%"
-            },
-            callback_webhook="https://httpbin.org/post",
-            state="pending",
-            metadata={
-                "workflow_id": "wf-test-002",
-                "checkpoint_id": "cp-deploy-approval",
-                "agent_id": "test-agent"
-            }
-        )
-        db.add(sample2)
-
-        db.commit()
-        print(f"   ✓ Created 2 sample consultation requests")
+        # One executemany INSERT for all samples (no per-object unit-of-work
+        # bookkeeping) - copy this pattern for larger seed sets
+        await db.execute(insert(ConsultationRequest), _SAMPLE_REQUESTS)
+
+        await db.commit()
+        print(f"   ✓ Created {len(_SAMPLE_REQUESTS)} sample consultation requests")
 
         print("\n✅ Test data created successfully!")
         print("\n📖 Next steps:")
@@ -136,12 +178,9 @@ def create_test_data():
 
     except Exception as e:
         print(f"\n❌ Error: {e}")
-        db.rollback()
+        await db.rollback()
         raise
 
-    finally:
-        db.close()
-
 
 if __name__ == "__main__":
-    create_test_data()
+    asyncio.run(create_test_data())